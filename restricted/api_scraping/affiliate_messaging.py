@@ -15,6 +15,13 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import settings
 
+try:
+    import pandas as pd
+
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
 sys.path.append(
     os.path.dirname(
         os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -153,7 +160,7 @@ class AffiliateMessageSender:
                         'position': position,
                         'organization_type': organization_type,
                         'source_url': source_url,
-                        'first_name': full_name.split()[0] if full_name.split() else ''
+                        'first_name': (full_name.split(None, 1) or [''])[0]
                     }
 
                     targets.append(target)
@@ -187,9 +194,9 @@ class AffiliateMessageSender:
     ):
         """Update CSV with affiliate messaging status"""
         try:
-            import pandas as pd
-            from datetime import datetime
-            
+            if not PANDAS_AVAILABLE:
+                raise ImportError("pandas not available")
+
             # Load CSV
             df = pd.read_csv(csv_file)
             
@@ -229,8 +236,8 @@ class AffiliateMessageSender:
                     df['valid'] = df['valid'].astype('object')  # Convert to object type first
                     df.at[user_row_idx, 'valid'] = valid
                 
-                # Save back to CSV
-                df.to_csv(csv_file, index=False, encoding='utf-8')
+                # Save back to CSV (swapped in atomically)
+                self.data_processor.write_csv_atomic(df, csv_file)
                 return True
             else:
                 print(f"       ⚠️ User not found in CSV for status update")
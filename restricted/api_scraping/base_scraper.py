@@ -4,23 +4,271 @@ Updated to use Firefox browser
 """
 
 from playwright.sync_api import sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 import json
 import time
+import logging
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from typing import Optional, Dict, Any
 import os
+import atexit
+import hashlib
+import random
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit, quote
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+API_HEADERS = {"Content-Type": "application/json"}
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/121.0"
+
+# Authentication cookie issued by sbcconnect.com on login
+SESSION_COOKIE_NAME = ".AspNetCore.Cookies"
+
+# Saved session cookies older than this are not reused
+SESSION_STATE_MAX_AGE = 24 * 60 * 60
+
+# Connections the httpx client keeps open; covers the parallel search
+# pages and user detail requests so every thread reuses a live connection
+HTTP_POOL_SIZE = 10
+
+# Cached user details older than this are fetched again
+USER_CACHE_MAX_AGE = 24 * 60 * 60
+
+# User details kept in memory on top of the disk cache, for up to an hour;
+# the least recently used are dropped first
+USER_MEMORY_CACHE_MAX_AGE = 60 * 60
+USER_MEMORY_CACHE_SIZE = 10_000
+
+# Page resources never read by the scraper; blocked before they are fetched
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
+# Cookie banner accept buttons, matched in a single locator call. Matches
+# come in DOM order, so only button selectors are listed: a banner wrapper
+# or an unrelated "OK"/"Continue" button earlier on the page would
+# otherwise be clicked instead
+COOKIE_BANNER_SELECTOR = ", ".join(
+    [
+        # Generic accept buttons
+        'button:has-text("Accept")',
+        'button:has-text("Accept All")',
+        'button:has-text("I Accept")',
+        'button:has-text("Agree")',
+        'button:has-text("Got it")',
+        # Common class/id patterns, on buttons only
+        'button[id*="accept" i]',
+        'button[class*="accept" i]',
+        ".cookie-accept",
+        ".accept-cookies",
+        "#cookie-accept",
+        "#accept-cookies",
+        # More specific patterns
+        'button[data-testid*="accept"]',
+        'button[aria-label*="accept"]',
+        ".btn-accept",
+        ".button-accept",
+    ]
+)
+COOKIE_BANNER_TIMEOUT_MS = 1500
+
+# Profile kept between runs so caches, HSTS and cookies stay warm
+DEFAULT_USER_DATA_DIR = os.path.expanduser("~/.sbs-scraper/firefox")
+
+# Firefox preferences to avoid detection
+FIREFOX_USER_PREFS = {
+    "dom.webdriver.enabled": False,
+    "useAutomationExtension": False,
+    "general.platform.override": "MacIntel",
+    "general.useragent.override": USER_AGENT,
+}
+
+
+class BrowserPool:
+    """Keeps one Playwright driver and Firefox process alive for the whole run
+
+    Scrapers create their own (cheap) browser contexts on top of it. A
+    persistent profile is held by one scraper at a time, since they all
+    share its cookie jar; it stays open for the next one after release.
+    """
+
+    playwright = None
+    browsers = {}
+    persistent_contexts = {}
+    # user_data_dir -> (headless, options) the profile was opened with
+    persistent_options = {}
+    # Profiles currently held by a scraper
+    persistent_owners = set()
+
+    @classmethod
+    def _ensure_playwright(cls):
+        if cls.playwright is None:
+            cls.playwright = sync_playwright().start()
+        return cls.playwright
+
+    @classmethod
+    def get_or_launch(cls, headless=True):
+        """Returns the shared Playwright instance and a Firefox browser"""
+        cls._ensure_playwright()
+
+        browser = cls.browsers.get(headless)
+        if browser is None or not browser.is_connected():
+            browser = cls.playwright.firefox.launch(
+                headless=headless, firefox_user_prefs=FIREFOX_USER_PREFS
+            )
+            cls.browsers[headless] = browser
+
+        return cls.playwright, browser
+
+    @classmethod
+    def get_or_launch_persistent(
+        cls, user_data_dir, headless=True, **options
+    ):
+        """Returns the shared Playwright instance and a persistent context
+
+        A profile directory can only be opened once, so contexts are keyed
+        by directory and handed to one scraper until release_persistent().
+        Raises ValueError while another scraper here holds the profile,
+        and Playwright's error when another process holds its lock.
+        """
+        cls._ensure_playwright()
+
+        if user_data_dir in cls.persistent_owners:
+            raise ValueError(
+                f"profile {user_data_dir} is used by another scraper"
+            )
+
+        context = cls.persistent_contexts.get(user_data_dir)
+        if (
+            context is not None
+            and cls.persistent_options[user_data_dir] != (headless, options)
+        ):
+            # Nobody holds it, so reopen it with the new options
+            context.close()
+            cls._forget_persistent(user_data_dir)
+            context = None
+
+        if context is None:
+            os.makedirs(user_data_dir, exist_ok=True)
+            context = cls.playwright.firefox.launch_persistent_context(
+                user_data_dir,
+                headless=headless,
+                firefox_user_prefs=FIREFOX_USER_PREFS,
+                **options,
+            )
+            cls.persistent_contexts[user_data_dir] = context
+            cls.persistent_options[user_data_dir] = (headless, options)
+            context.on("close", lambda _: cls._forget_persistent(user_data_dir))
+
+        cls.persistent_owners.add(user_data_dir)
+        return cls.playwright, context
+
+    @classmethod
+    def release_persistent(cls, user_data_dir):
+        """Lets the next scraper take a persistent context over"""
+        cls.persistent_owners.discard(user_data_dir)
+
+    @classmethod
+    def _forget_persistent(cls, user_data_dir):
+        """Drops a persistent context that was closed"""
+        cls.persistent_contexts.pop(user_data_dir, None)
+        cls.persistent_options.pop(user_data_dir, None)
+        cls.persistent_owners.discard(user_data_dir)
+
+    @classmethod
+    def shutdown(cls):
+        """Closes every pooled browser and stops Playwright"""
+        for context in list(cls.persistent_contexts.values()):
+            try:
+                context.close()
+            except Exception:
+                pass
+        cls.persistent_contexts = {}
+        cls.persistent_options = {}
+        cls.persistent_owners = set()
+
+        for browser in cls.browsers.values():
+            try:
+                if browser.is_connected():
+                    browser.close()
+            except Exception:
+                pass
+        cls.browsers = {}
+
+        if cls.playwright:
+            try:
+                cls.playwright.stop()
+            except Exception:
+                pass
+            cls.playwright = None
+
+
+atexit.register(BrowserPool.shutdown)
+
+
+class _HttpxResponse:
+    """Exposes an httpx response through the APIResponse attributes api_request uses"""
+
+    def __init__(self, response):
+        self._response = response
+
+    @property
+    def ok(self):
+        return self._response.is_success
+
+    @property
+    def status(self):
+        return self._response.status_code
+
+    @property
+    def status_text(self):
+        return self._response.reason_phrase
+
+    def json(self):
+        return self._response.json()
+
+    def dispose(self):
+        self._response.close()
 
 
 class BaseScraper:
     """Base class for handling browser automation and API requests"""
 
-    def __init__(self, headless=True, proxy_config=None):
+    def __init__(
+        self,
+        headless=True,
+        proxy_config=None,
+        user_data_dir=DEFAULT_USER_DATA_DIR,
+        api_auth_mode=True,
+        refresh_cache=False,
+    ):
         self.headless = headless
         self.proxy_config = proxy_config
+        # None uses a throwaway context on the pooled browser instead
+        self.user_data_dir = user_data_dir
+        # Log in with the API call alone, without loading the site first
+        self.api_auth_mode = api_auth_mode
+        # Ignore cached user details and always hit the API
+        self.refresh_cache = refresh_cache
+        # user_id -> (monotonic time cached, details)
+        self._user_details_cache = OrderedDict()
+        self._user_details_lock = threading.Lock()
         self.playwright = None
         self.browser = None
         self.context = None
+        self.api = None
+        self.http = None
         self.page = None
         self.is_logged_in = False
         self.current_account = None
@@ -37,23 +285,52 @@ class BaseScraper:
     def start(self):
         """Starts the browser and logs in"""
         print("🚀 Запускаємо браузер...")
-        self.playwright = sync_playwright().start()
-        
+        if self.proxy_config:
+            print(f"🌐 Використовуємо proxy: {self.proxy_config['server']}")
+        else:
+            print("📡 Працюємо без proxy")
+
         # Use Firefox instead of Chromium
-        self.browser = self.playwright.firefox.launch(
-            headless=self.headless,
-            firefox_user_prefs={
-                # Firefox preferences to avoid detection
-                "dom.webdriver.enabled": False,
-                "useAutomationExtension": False,
-                "general.platform.override": "MacIntel",
-                "general.useragent.override": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/121.0"
-            }
-        )
-        
+        persistent = False
+        if self.user_data_dir:
+            # The persistent profile keeps caches and cookies between runs
+            try:
+                playwright, context = BrowserPool.get_or_launch_persistent(
+                    self.user_data_dir,
+                    self.headless,
+                    **self._context_options(),
+                )
+                persistent = True
+            except Exception as e:
+                # Locked by another process, or held by another scraper
+                # here whose account switches would log this one out
+                print(
+                    f"⚠️ Профіль {self.user_data_dir} недоступний ({e}), "
+                    "використовуємо тимчасовий контекст"
+                )
+                # close() then closes the throwaway context as its own
+                self.user_data_dir = None
+
+        if persistent:
+            self.playwright, self.context = playwright, context
+            self.browser = None
+            self.page = None
+            self._setup_context()
+        else:
+            # The process is shared between scrapers and only the context
+            # is our own
+            self.playwright, self.browser = BrowserPool.get_or_launch(
+                self.headless
+            )
+            self._create_context()
+
+        return True
+
+    def _context_options(self):
+        """Builds the options used for every browser context"""
         # Create context with Firefox-appropriate settings and proxy if provided
         context_options = {
-            "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:109.0) Gecko/20100101 Firefox/121.0",
+            "user_agent": USER_AGENT,
             "viewport": {"width": 1920, "height": 1080},
             "locale": "en-US",
             "timezone_id": "America/New_York"
@@ -61,20 +338,31 @@ class BaseScraper:
         
         # Add proxy configuration if provided
         if self.proxy_config:
-            print(f"🌐 Використовуємо proxy: {self.proxy_config['server']}")
             context_options["proxy"] = {
                 "server": self.proxy_config["server"],
                 "username": self.proxy_config["username"],
                 "password": self.proxy_config["password"]
             }
-        else:
-            print("📡 Працюємо без proxy")
-        
-        self.context = self.browser.new_context(**context_options)
-        self.page = self.context.new_page()
-        
-        # Add Firefox-specific stealth techniques
-        self.page.add_init_script("""
+
+        return context_options
+
+    def _create_context(self):
+        """Creates a fresh browser context with its own cookie jar"""
+        self.context = self.browser.new_context(**self._context_options())
+        self.page = None
+        self._setup_context()
+
+    def _setup_context(self):
+        """Prepares a freshly obtained context for API use"""
+        # All API traffic goes through the context's APIRequestContext, which
+        # shares cookies with the context but needs no page of its own
+        self.api = self.context.request
+
+        # Pages are only opened to mint session cookies
+        self.context.route("**/*", self._block_heavy_resources)
+
+        # Add Firefox-specific stealth techniques to any page opened later
+        self.context.add_init_script("""
             // Remove webdriver traces
             Object.defineProperty(navigator, 'webdriver', {
                 get: () => undefined,
@@ -100,58 +388,42 @@ class BaseScraper:
                 get: () => ['en-US', 'en']
             });
         """)
-        
-        return True
+
+    @staticmethod
+    def _block_heavy_resources(route):
+        """Aborts requests for resources the scraper never reads"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
+    def _ensure_page(self):
+        """Opens a page lazily, only when a real navigation is needed"""
+        if self.page is None:
+            # A persistent context already starts with a blank page
+            pages = self.context.pages
+            self.page = pages[0] if pages else self.context.new_page()
+        return self.page
 
     def accept_cookies(self):
         """Accept cookies if cookie banner is present"""
         print("🍪 Checking for cookie consent banner...")
-        
+
         try:
-            # Common cookie banner selectors
-            cookie_selectors = [
-                # Generic accept buttons
-                'button:has-text("Accept")',
-                'button:has-text("Accept All")',
-                'button:has-text("Accept all")',
-                'button:has-text("I Accept")',
-                'button:has-text("OK")',
-                'button:has-text("Agree")',
-                'button:has-text("Got it")',
-                'button:has-text("Continue")',
-                
-                # Common class/id patterns
-                '[id*="accept"]',
-                '[class*="accept"]',
-                '[id*="cookie"]',
-                '[class*="cookie"]',
-                '.cookie-accept',
-                '.accept-cookies',
-                '#cookie-accept',
-                '#accept-cookies',
-                
-                # More specific patterns
-                'button[data-testid*="accept"]',
-                'button[aria-label*="accept"]',
-                '.btn-accept',
-                '.button-accept'
-            ]
-            
-            # Try each selector
-            for selector in cookie_selectors:
-                try:
-                    element = self.page.query_selector(selector)
-                    if element and element.is_visible():
-                        print(f"✅ Found cookie accept button: {selector}")
-                        element.click()
-                        print("✅ Clicked cookie accept button")
-                        return True
-                except:
-                    continue
-            
+            # One compound locator instead of a round-trip per selector
+            button = (
+                self.page.locator(COOKIE_BANNER_SELECTOR)
+                .filter(visible=True)
+                .first
+            )
+            button.click(timeout=COOKIE_BANNER_TIMEOUT_MS)
+            print("✅ Clicked cookie accept button")
+            return True
+
+        except PlaywrightTimeoutError:
             print("⚠️ No cookie banner found or already accepted")
             return True
-            
+
         except Exception as e:
             print(f"⚠️ Error handling cookies: {e}")
             return True  # Continue anyway
@@ -165,66 +437,245 @@ class BaseScraper:
         account = accounts[account_key]
         self.current_account = account_key
 
-        print("📄 Відкриваємо sbcconnect.com...")
-        self.page.goto("https://sbcconnect.com", wait_until="domcontentloaded")        
-        # Accept cookies first
-        self.accept_cookies()
+        if self._restore_session(account_key, account):
+            print(f"♻️ Використовуємо збережену сесію {account['name']}")
+            self.is_logged_in = True
+            self._open_http_session()
+            return True
+
+        # The auth cookie comes from the login API response; the page and
+        # its cookie banner are only needed for browser-based auth
+        if not self.api_auth_mode:
+            print("📄 Відкриваємо sbcconnect.com...")
+            self._ensure_page().goto(
+                "https://sbcconnect.com", wait_until="commit"
+            )
+            # Accept cookies first
+            self.accept_cookies()
 
         print(f"🔑 Логінимося з {account['name']}...")
-        result = self.page.evaluate(
-            """
-            async (credentials) => {
-                const response = await fetch('https://sbcconnect.com/api/account/login', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({
-                        username: credentials.username,
-                        password: credentials.password,
-                        rememberMe: true
-                    })
-                });
-                const data = await response.json();
-                return {status: response.status, data: data};
-            }
-            """,
-            {"username": account["username"], "password": account["password"]},
+        response = self.api.post(
+            "https://sbcconnect.com/api/account/login",
+            headers=API_HEADERS,
+            data={
+                "username": account["username"],
+                "password": account["password"],
+                "rememberMe": True,
+            },
         )
+        try:
+            data = response.json()
+        except Exception:
+            data = None
+        result = {"status": response.status, "data": data}
 
         if result["status"] == 200:
             print(f"✅ Успішно залогінились як {account['name']}")
             self.is_logged_in = True
+            self._save_session(account_key)
+            self._open_http_session()
             return True
         else:
             print(f"❌ Помилка логіну: {result}")
             return False
 
+    def _state_path(self, account_key):
+        """Returns the path of the saved session state for an account"""
+        return os.path.join(
+            self.get_data_dir(), "sessions", f"{account_key}.json"
+        )
+
+    def _restore_session(self, account_key, account):
+        """Loads saved session cookies and checks the server still accepts them"""
+        path = self._state_path(account_key)
+        if not os.path.exists(path):
+            return False
+        user_id = account.get("user_id")
+        if not user_id:
+            # The saved cookies can only be checked with the account's id
+            logger.info(
+                "ℹ️ Акаунт %s без user_id - збережену сесію не перевіряємо",
+                account_key,
+            )
+            return False
+        if time.time() - os.path.getmtime(path) > SESSION_STATE_MAX_AGE:
+            return False
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+
+            # Replace whatever the previous account left in the context
+            self.context.clear_cookies()
+            self.context.add_cookies(state.get("cookies", []))
+
+            response = self.api.get(
+                f"https://sbcconnect.com/api/user/getById?userId={user_id}&eventPath=sbc-summit-2025",
+                headers=API_HEADERS,
+                timeout=10000,
+            )
+            try:
+                # An expired session is answered with an error or a login page
+                is_valid = response.ok and bool(response.json())
+            finally:
+                response.dispose()
+        except Exception:
+            is_valid = False
+
+        if not is_valid:
+            self.context.clear_cookies()
+        return is_valid
+
+    def _save_session(self, account_key):
+        """Stores the session cookies so the next run can skip the login"""
+        path = self._state_path(account_key)
+        try:
+            self._sync_cookies_from_http()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self.context.storage_state(path=path)
+        except Exception as e:
+            print(f"⚠️ Не вдалося зберегти сесію: {e}")
+
+    def _forget_session(self, account_key):
+        """Deletes the saved session of an account that logged out"""
+        if not account_key:
+            return
+        try:
+            os.remove(self._state_path(account_key))
+        except OSError:
+            pass
+
+    def _has_live_session_cookie(self):
+        """Checks locally whether the session cookie is present and not expired"""
+        try:
+            self._sync_cookies_from_http()
+            cookies = self.context.cookies("https://sbcconnect.com")
+        except Exception:
+            # Can't tell locally - let the server decide
+            return True
+
+        for cookie in cookies:
+            if cookie.get("name") == SESSION_COOKIE_NAME:
+                expires = cookie.get("expires", -1)
+                # -1 marks a browser-session cookie without an expiry date
+                return expires == -1 or expires > time.time()
+
+        return False
+
+    def _open_http_session(self):
+        """Moves the authenticated session from the browser to an httpx client
+
+        The browser is only needed to mint the session cookies; afterwards
+        API calls go straight over a pooled HTTP/2 connection.
+        """
+        self._close_http_session()
+        if not HTTPX_AVAILABLE:
+            return
+
+        # Domain and path are kept so the cookies can be copied back later
+        cookies = httpx.Cookies()
+        for c in self.context.cookies("https://sbcconnect.com"):
+            cookies.set(
+                c["name"], c["value"], domain=c["domain"], path=c["path"]
+            )
+        client_options = {
+            "headers": {**API_HEADERS, "User-Agent": USER_AGENT},
+            "cookies": cookies,
+            "limits": httpx.Limits(
+                max_connections=HTTP_POOL_SIZE,
+                max_keepalive_connections=HTTP_POOL_SIZE,
+            ),
+        }
+        if self.proxy_config:
+            client_options["proxy"] = self._proxy_url()
+
+        try:
+            self.http = httpx.Client(http2=True, **client_options)
+        except ImportError:
+            # HTTP/2 support needs the optional h2 package
+            self.http = httpx.Client(**client_options)
+
+    def _close_http_session(self):
+        """Closes the httpx client if one is open"""
+        if self.http:
+            self._sync_cookies_from_http()
+            self.http.close()
+            self.http = None
+
+    def _sync_cookies_from_http(self):
+        """Copies the httpx cookie jar back into the browser context
+
+        The server refreshes and expires cookies on API responses, which go
+        through httpx once it is open; the context copy is what gets saved,
+        checked and used for logout.
+        """
+        if not self.http or not self.context:
+            return
+
+        cookies = []
+        for cookie in self.http.cookies.jar:
+            entry = {
+                "name": cookie.name,
+                "value": cookie.value or "",
+                "expires": cookie.expires if cookie.expires else -1,
+                "secure": bool(cookie.secure),
+                "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+            }
+            if cookie.domain:
+                entry["domain"] = cookie.domain
+                entry["path"] = cookie.path or "/"
+            else:
+                entry["url"] = "https://sbcconnect.com"
+            cookies.append(entry)
+
+        # Mirror the jar, so cookies the server expired are gone here too
+        self.context.clear_cookies()
+        if cookies:
+            self.context.add_cookies(cookies)
+
+    def _proxy_url(self):
+        """Builds a proxy URL with embedded credentials for httpx"""
+        parts = urlsplit(self.proxy_config["server"])
+        netloc = parts.netloc
+        if self.proxy_config.get("username"):
+            credentials = quote(self.proxy_config["username"], safe="")
+            if self.proxy_config.get("password"):
+                credentials += ":" + quote(
+                    self.proxy_config["password"], safe=""
+                )
+            netloc = f"{credentials}@{netloc}"
+        return urlunsplit(parts._replace(netloc=netloc))
+
     def logout(self):
         """Logs out from the current account"""
         if not self.is_logged_in:
             print("⚠️ Немає активного логіну")
             return True
 
+        if not self._has_live_session_cookie():
+            print("⚠️ Сесія вже завершилась, вихід на сервері не потрібен")
+            self._forget_session(self.current_account)
+            self.is_logged_in = False
+            self.current_account = None
+            self._close_http_session()
+            return True
+
         print("🚪 Виходимо з поточного акаунта...")
-        result = self.page.evaluate(
-            """
-            async () => {
-                try {
-                    const response = await fetch('https://sbcconnect.com/api/account/logout', {
-                        method: 'POST',
-                        headers: {'Content-Type': 'application/json'}
-                    });
-                    return {status: response.status, data: await response.text()};
-                } catch (error) {
-                    return {status: 500, error: error.message};
-                }
-            }
-        """
-        )
+        try:
+            response = self.api.post(
+                "https://sbcconnect.com/api/account/logout",
+                headers=API_HEADERS,
+            )
+            result = {"status": response.status, "data": response.text()}
+        except Exception as e:
+            result = {"status": 500, "error": str(e)}
 
         if result["status"] == 200 or result["status"] == 404:
             print("✅ Успішно вийшли з акаунта")
+            self._forget_session(self.current_account)
             self.is_logged_in = False
             self.current_account = None
+            self._close_http_session()
             return True
         else:
             print(f"❌ Помилка виходу: {result}")
@@ -233,7 +684,7 @@ class BaseScraper:
     def api_request(
         self, method, endpoint, data=None, max_retries=5, timeout_seconds=10
     ):
-        """Performs API request through browser with timeout and retries"""
+        """Performs API request through the context's request API with timeout and retries"""
         if not self.is_logged_in:
             print("❌ Не залогінені для виконання API запитів")
             return None
@@ -244,118 +695,103 @@ class BaseScraper:
             else endpoint
         )
 
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            print(f"❌ Непідтримуваний HTTP метод: {method}")
+            return None
+
+        # Set timeout for the entire operation
+        timeout_ms = timeout_seconds * 1000
+
         for attempt in range(max_retries):
             try:
-                # Set timeout for the entire operation
-                timeout_ms = timeout_seconds * 1000
-
-                if method.upper() == "GET":
-                    result = self.page.evaluate(
-                        """
-                        async (params) => {
-                            const controller = new AbortController();
-                            const timeoutId = setTimeout(() => controller.abort(), params.timeoutMs);
-                            
-                            try {
-                                const response = await fetch(params.url, {
-                                    method: 'GET',
-                                    headers: {'Content-Type': 'application/json'},
-                                    signal: controller.signal
-                                });
-                                clearTimeout(timeoutId);
-                                
-                                if (response.ok) {
-                                    const data = await response.json();
-                                    return {status: response.status, data: data, success: true};
-                                } else {
-                                    return {status: response.status, error: 'HTTP Error', success: false};
-                                }
-                            } catch (error) {
-                                clearTimeout(timeoutId);
-                                return {status: 500, error: error.message, success: false};
-                            }
-                        }
-                        """,
-                        {"url": url, "timeoutMs": timeout_ms},
+                response = self._send_api_request(
+                    method, url, data, timeout_ms
+                )
+
+                if response.ok:
+                    return self._read_api_response(response, method)
+
+                error = response.status_text or "HTTP Error"
+                response.dispose()
+
+                if attempt < max_retries - 1:
+                    delay = self._backoff_delay(attempt)
+                    logger.warning(
+                        "⚠️ Спроба %d/%d невдала, повторюємо через %.1f сек...",
+                        attempt + 1,
+                        max_retries,
+                        delay,
                     )
-                elif method.upper() == "POST":
-                    json_data = json.dumps(data) if data else "{}"
-                    result = self.page.evaluate(
-                        """
-                        async (params) => {
-                            const controller = new AbortController();
-                            const timeoutId = setTimeout(() => controller.abort(), params.timeoutMs);
-                            
-                            try {
-                                const response = await fetch(params.url, {
-                                    method: 'POST',
-                                    headers: {'Content-Type': 'application/json'},
-                                    body: params.jsonData,
-                                    signal: controller.signal
-                                });
-                                clearTimeout(timeoutId);
-                                
-                                if (response.ok) {
-                                    try {
-                                        const data = await response.json();
-                                        return {status: response.status, data: data, success: true};
-                                    } catch (e) {
-                                        // Some responses might not be JSON
-                                        return {status: response.status, data: true, success: true};
-                                    }
-                                } else {
-                                    return {status: response.status, error: 'HTTP Error', success: false};
-                                }
-                            } catch (error) {
-                                clearTimeout(timeoutId);
-                                return {status: 500, error: error.message, success: false};
-                            }
-                        }
-                        """,
-                        {
-                            "url": url,
-                            "jsonData": json_data,
-                            "timeoutMs": timeout_ms,
-                        },
+                    logger.warning(
+                        "   📊 Статус: %s, Помилка: %s", response.status, error
                     )
+                    time.sleep(delay)
                 else:
-                    print(f"❌ Непідтримуваний HTTP метод: {method}")
-                    return None
-
-                if result and result.get("success"):
-                    return result.get("data")
-                else:
-                    if attempt < max_retries - 1:
-                        # Exponential backoff: 2, 4, 8, 16 seconds
-                        delay = 2 ** (attempt + 1)
-                        print(
-                            f"⚠️ Спроба {attempt + 1}/{max_retries} невдала, повторюємо через {delay} сек..."
-                        )
-                        if result:
-                            print(
-                                f"   📊 Статус: {result.get('status')}, Помилка: {result.get('error', 'Невідома')}"
-                            )
-                        time.sleep(delay)
-                    else:
-                        print(f"❌ Всі {max_retries} спроб API запиту невдалі")
-                        if result:
-                            print(
-                                f"   📊 Останній статус: {result.get('status')}, Помилка: {result.get('error', 'Невідома')}"
-                            )
+                    logger.error("❌ Всі %d спроб API запиту невдалі", max_retries)
+                    logger.error(
+                        "   📊 Останній статус: %s, Помилка: %s",
+                        response.status,
+                        error,
+                    )
 
             except Exception as e:
                 if attempt < max_retries - 1:
-                    # Exponential backoff: 2, 4, 8, 16 seconds
-                    delay = 2 ** (attempt + 1)
-                    print(
-                        f"⚠️ Помилка на спробі {attempt + 1}/{max_retries}: {e}, повторюємо через {delay} сек..."
+                    delay = self._backoff_delay(attempt)
+                    logger.warning(
+                        "⚠️ Помилка на спробі %d/%d: %s, повторюємо через %.1f сек...",
+                        attempt + 1,
+                        max_retries,
+                        e,
+                        delay,
                     )
                     time.sleep(delay)
                 else:
-                    print(f"❌ Критична помилка API запиту: {e}")
+                    logger.error("❌ Критична помилка API запиту: %s", e)
 
         return None
 
+    @staticmethod
+    def _backoff_delay(attempt):
+        """Exponential backoff with jitter: up to 2, 4, 8, 16 seconds
+
+        Random delays keep concurrent page fetches from retrying in lockstep.
+        """
+        return random.uniform(1, min(16, 2 ** (attempt + 1)))
+
+    def _send_api_request(self, method, url, data, timeout_ms):
+        """Issues a single request over httpx, or the APIRequestContext before it exists"""
+        if self.http:
+            return _HttpxResponse(
+                self.http.request(
+                    method,
+                    url,
+                    json=(data or {}) if method == "POST" else None,
+                    timeout=timeout_ms / 1000,
+                )
+            )
+
+        if method == "GET":
+            return self.api.get(url, headers=API_HEADERS, timeout=timeout_ms)
+
+        # Playwright serializes a dict body as JSON itself
+        return self.api.post(
+            url, headers=API_HEADERS, data=data or {}, timeout=timeout_ms
+        )
+
+    def _read_api_response(self, response, method):
+        """Reads the JSON body of a successful response and releases it"""
+        try:
+            if method == "GET":
+                return response.json()
+            try:
+                return response.json()
+            except Exception:
+                # Some responses might not be JSON
+                return True
+        finally:
+            response.dispose()
+
     def advanced_search(self, from_index=0, size=2000):
         """Performs advanced search with filters"""
         search_params = {
@@ -385,40 +821,198 @@ class BaseScraper:
         endpoint = f"attendee/advancedSearch?eventPath=sbc-summit-2025&from={from_index}&size={size}"
         return self.api_request("POST", endpoint, search_params)
 
-    def get_all_advanced_search_results(self):
-        """Gets all advanced search results"""
-        all_results = []
+    def _can_prefetch(self):
+        """Whether API requests may be issued from a background thread
+
+        Playwright's sync API is bound to the thread that started it, so
+        requests through self.api must stay on the calling thread. The
+        httpx client is thread-safe.
+        """
+        return self.http is not None
+
+    def iter_advanced_search_results(self, size=2000):
+        """Yields advanced search results page by page
+
+        When the transport allows it, the next page is requested in the
+        background while the caller is still processing the current one.
+        """
+        executor = (
+            ThreadPoolExecutor(max_workers=1) if self._can_prefetch() else None
+        )
+        pending = None
         from_index = 0
-        size = 2000  # Maximum size
 
-        while True:
-            print(f"📥 Отримуємо результати з індексу {from_index}...")
-            results = self.advanced_search(from_index, size)
+        try:
+            while True:
+                logger.debug(
+                    "📥 Отримуємо результати з індексу %d...", from_index
+                )
+                if pending is not None:
+                    results = pending.result()
+                    pending = None
+                else:
+                    results = self.advanced_search(from_index, size)
+
+                if not results:
+                    logger.error("❌ Не вдалося отримати результати пошуку")
+                    return
 
-            if not results:
-                print("❌ Не вдалося отримати результати пошуку")
-                break
+                if not isinstance(results, list):
+                    logger.error("❌ Неочікуваний формат результатів")
+                    return
+
+                logger.debug("✅ Отримано %d результатів", len(results))
+
+                # A full page means there may be more - start fetching it now
+                if executor and len(results) >= size:
+                    pending = executor.submit(
+                        self.advanced_search, from_index + size, size
+                    )
 
-            if not isinstance(results, list):
-                print("❌ Неочікуваний формат результатів")
-                break
+                yield results
 
-            print(f"✅ Отримано {len(results)} результатів")
-            all_results.extend(results)
+                # If we got less than the requested size, we've reached the end
+                if len(results) < size:
+                    logger.info("✅ Отримали всі результати")
+                    return
 
-            # If we got less than the requested size, we've reached the end
-            if len(results) < size:
-                print("✅ Отримали всі результати")
-                break
+                from_index += size
+        finally:
+            if executor:
+                executor.shutdown(wait=True, cancel_futures=True)
 
-            from_index += size
+    def get_all_advanced_search_results(self, size=2000, max_workers=8):
+        """Gets all advanced search results
 
+        With a thread-safe transport, pages are requested concurrently in
+        windows of max_workers pages; otherwise they are walked one by one.
+        """
+        if not self._can_prefetch():
+            all_results = []
+            for results in self.iter_advanced_search_results(size):
+                all_results.extend(results)
+            return all_results
+
+        logger.debug("📥 Отримуємо результати з індексу 0...")
+        first_page = self.advanced_search(0, size)
+        if not first_page:
+            logger.error("❌ Не вдалося отримати результати пошуку")
+            return []
+        if not isinstance(first_page, list):
+            logger.error("❌ Неочікуваний формат результатів")
+            return []
+
+        logger.debug("✅ Отримано %d результатів", len(first_page))
+        pages = [first_page]
+        from_index = size
+        reached_end = len(first_page) < size
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while not reached_end:
+                window = range(
+                    from_index, from_index + max_workers * size, size
+                )
+                logger.debug(
+                    "📥 Отримуємо результати з індексів %d-%d паралельно...",
+                    window[0],
+                    window[-1],
+                )
+                # map() keeps the pages in from_index order
+                batch = list(
+                    executor.map(
+                        lambda index: self.advanced_search(index, size), window
+                    )
+                )
+
+                for results in batch:
+                    # An empty or short page marks the end of the results
+                    if not results or not isinstance(results, list):
+                        reached_end = True
+                        break
+                    pages.append(results)
+                    if len(results) < size:
+                        reached_end = True
+                        break
+
+                from_index += max_workers * size
+
+        all_results = list(itertools.chain.from_iterable(pages))
+        logger.info("✅ Отримали всі результати: %d", len(all_results))
         return all_results
 
     def get_user_details(self, user_id):
-        """Gets detailed user information"""
+        """Gets detailed user information, cached on disk for a day
+
+        Lookups are also kept in memory for up to an hour, so a repeated
+        user costs neither a request nor a file read.
+        """
+        if not self.refresh_cache:
+            cached = self._get_memory_cached_user(user_id)
+            if cached is not None:
+                return cached
+
+        cache_path = self._user_cache_path(user_id)
+
+        if not self.refresh_cache:
+            cached = self._read_user_cache(cache_path)
+            if cached is not None:
+                self._remember_user(user_id, cached)
+                return cached
+
         endpoint = f"user/getById?userId={user_id}&eventPath=sbc-summit-2025"
-        return self.api_request("GET", endpoint)
+        result = self.api_request("GET", endpoint)
+        if result:
+            self._write_user_cache(cache_path, result)
+            self._remember_user(user_id, result)
+        return result
+
+    def _get_memory_cached_user(self, user_id):
+        """Returns user details from memory, or None when missing or stale"""
+        with self._user_details_lock:
+            entry = self._user_details_cache.get(user_id)
+            if entry is None:
+                return None
+            cached_at, details = entry
+            if time.monotonic() - cached_at > USER_MEMORY_CACHE_MAX_AGE:
+                del self._user_details_cache[user_id]
+                return None
+            self._user_details_cache.move_to_end(user_id)
+            return details
+
+    def _remember_user(self, user_id, details):
+        """Keeps user details in memory, evicting the least recently used"""
+        with self._user_details_lock:
+            self._user_details_cache[user_id] = (time.monotonic(), details)
+            self._user_details_cache.move_to_end(user_id)
+            if len(self._user_details_cache) > USER_MEMORY_CACHE_SIZE:
+                self._user_details_cache.popitem(last=False)
+
+    def _user_cache_path(self, user_id):
+        """Returns the cache file for a user, named by a hash of the id"""
+        key = hashlib.sha1(f"user:{user_id}".encode("utf-8")).hexdigest()
+        return os.path.join(self.get_data_dir(), ".user_cache", f"{key}.json")
+
+    def _read_user_cache(self, cache_path):
+        """Returns cached user details, or None when missing or stale"""
+        try:
+            age = time.time() - os.path.getmtime(cache_path)
+            if age > USER_CACHE_MAX_AGE:
+                return None
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_user_cache(self, cache_path, data):
+        """Stores user details; a failed write only costs a refetch later"""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError) as e:
+            print(f"⚠️ Не вдалося закешувати дані користувача: {e}")
 
     def switch_account(self, account_key, accounts):
         """Switches to a different account"""
@@ -432,15 +1026,31 @@ class BaseScraper:
         if self.is_logged_in:
             self.logout()
 
+        # A fresh context is far cheaper than a new browser and starts
+        # with an empty cookie jar for the next account
+        self._close_http_session()
+        if self.user_data_dir:
+            # The persistent profile cannot be reopened, so just drop cookies
+            self.context.clear_cookies()
+        else:
+            if self.context:
+                self.context.close()
+            self._create_context()
+
         # Login with new account
         return self.login(account_key, accounts)
 
     def close(self):
         """Closes the browser and cleans up resources"""
-        if self.context:
+        if self.is_logged_in and self.current_account:
+            # Keep the cookies the server refreshed during this run
+            self._save_session(self.current_account)
+        self._close_http_session()
+        if self.context and self.user_data_dir:
+            BrowserPool.release_persistent(self.user_data_dir)
+        elif self.context:
             self.context.close()
-        if self.browser:
-            self.browser.close()
-        if self.playwright:
-            self.playwright.stop()
+        self.context = None
+        # The pooled browser and persistent profile stay alive for other
+        # scrapers and are shut down by BrowserPool at interpreter exit
         print("🔒 Браузер закрито")
\ No newline at end of file
@@ -4,8 +4,61 @@ Company filtering functionality for excluded companies and similarity matching
 
 import os
 import re
+import csv
+import bisect
+import functools
 from typing import List, Dict, Tuple
 
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from rapidfuzz import process as fuzz_process
+    from rapidfuzz.distance import Levenshtein
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Anything that is not alphanumeric or whitespace (\w also matches "_")
+_STRIP_RE = re.compile(r"[^\w\s]|_")
+_WS_RE = re.compile(r"\s+")
+
+# Common company suffixes, stripped from the end of a lowercased name
+_SUFFIX_RE = re.compile(
+    r"(?:\s+(?:ltd|llc|inc|corp(?:oration)?|company|co|s\.a\.c|s\.a|b\.v"
+    r"|gmbh|ag|s\.r\.l|srl|limited|entertainment|gaming|games|casinos?"
+    r"|betting|bet|payments?|pay))+\s*$"
+)
+
+
+@functools.lru_cache(maxsize=65536)
+def _normalize_company_name(company_name: str) -> str:
+    """Normalizes company name for better comparison
+
+    Pure function of its input, so results are memoized across calls.
+    """
+    if not company_name:
+        return ""
+
+    # Convert to lowercase and remove common suffixes/prefixes
+    normalized = company_name.lower().strip()
+
+    # Remove common company suffixes, repeatedly ("X Gaming Ltd" -> "x")
+    normalized = _SUFFIX_RE.sub("", normalized)
+
+    # Remove special characters but keep spaces and alphanumeric
+    normalized = _STRIP_RE.sub("", normalized)
+
+    # Remove extra spaces
+    normalized = _WS_RE.sub(" ", normalized).strip()
+
+    return normalized
+
 
 class CompanyFilter:
     """Handles company exclusion logic and similarity matching"""
@@ -13,6 +66,13 @@ class CompanyFilter:
     def __init__(self, data_dir: str):
         self.data_dir = data_dir
         self.excluded_companies = []
+        self._fuzzy_choices = []
+        self._fuzzy_originals = []
+        self._exact_matches = {}
+        self._by_length = {}
+        self._automaton = None
+        self._haystack = ""
+        self._offsets = []
         self._load_excluded_companies()
 
     def _load_excluded_companies(self):
@@ -25,11 +85,16 @@ class CompanyFilter:
 
         try:
             self.excluded_companies = []
-            with open(exclude_file, "r", encoding="utf-8") as f:
+            # utf-8-sig drops a BOM that would otherwise stick to a name
+            with open(
+                exclude_file, "r", encoding="utf-8-sig", newline=""
+            ) as f:
+                reader = csv.reader(f)
                 # Skip header
-                next(f)
-                for line in f:
-                    company_name = line.strip()
+                next(reader, None)
+                for row in reader:
+                    # The file has a single column; rejoin unquoted commas
+                    company_name = ",".join(row).strip()
                     if company_name:
                         # Normalize company name for better matching
                         normalized = self._normalize_company_name(company_name)
@@ -37,9 +102,12 @@ class CompanyFilter:
                             {
                                 "original": company_name,
                                 "normalized": normalized,
+                                "length": len(normalized),
                             }
                         )
 
+            self._index_excluded_companies()
+
             print(
                 f"📋 Завантажено {len(self.excluded_companies)} компаній до списку виключень"
             )
@@ -47,62 +115,57 @@ class CompanyFilter:
         except Exception as e:
             print(f"❌ Помилка завантаження списку виключень: {e}")
 
+    def _index_excluded_companies(self):
+        """Prepares the candidate lists used for fuzzy matching"""
+        # Very short names are never compared
+        candidates = [c for c in self.excluded_companies if c["length"] >= 3]
+        self._fuzzy_choices = [c["normalized"] for c in candidates]
+        self._fuzzy_originals = [c["original"] for c in candidates]
+
+        # Normalized name -> first excluded company with it, for the
+        # direct match check
+        self._exact_matches = {}
+        for normalized, original in zip(
+            self._fuzzy_choices, self._fuzzy_originals
+        ):
+            self._exact_matches.setdefault(normalized, original)
+
+        # Positions of candidates grouped by normalized length
+        self._by_length = {}
+        for index, candidate in enumerate(candidates):
+            self._by_length.setdefault(candidate["length"], []).append(index)
+
+        # One automaton pass finds every excluded name inside an input
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self._fuzzy_choices:
+            self._automaton = ahocorasick.Automaton()
+            for index, normalized in enumerate(self._fuzzy_choices):
+                # Duplicates keep the first position, like the old scan
+                if normalized not in self._automaton:
+                    self._automaton.add_word(normalized, index)
+            self._automaton.make_automaton()
+
+        # Joined names let one find() locate an input inside excluded names;
+        # normalized names never contain the separator
+        self._haystack = "\x00".join(self._fuzzy_choices)
+        self._offsets = []
+        offset = 0
+        for normalized in self._fuzzy_choices:
+            self._offsets.append(offset)
+            offset += len(normalized) + 1
+
     def _normalize_company_name(self, company_name: str) -> str:
         """Normalizes company name for better comparison"""
-        if not company_name:
-            return ""
-
-        # Convert to lowercase and remove common suffixes/prefixes
-        normalized = company_name.lower().strip()
-
-        # Remove common company suffixes
-        suffixes_to_remove = [
-            " ltd",
-            " llc",
-            " inc",
-            " corp",
-            " corporation",
-            " company",
-            " co",
-            " s.a.c",
-            " s.a",
-            " b.v",
-            " gmbh",
-            " ag",
-            " s.r.l",
-            " srl",
-            " limited",
-            " entertainment",
-            " gaming",
-            " games",
-            " casino",
-            " casinos",
-            " betting",
-            " bet",
-            " pay",
-            " payment",
-            " payments",
-        ]
-
-        for suffix in suffixes_to_remove:
-            if normalized.endswith(suffix):
-                normalized = normalized[: -len(suffix)].strip()
-
-        # Remove special characters but keep spaces and alphanumeric
-        normalized = "".join(
-            c for c in normalized if c.isalnum() or c.isspace()
-        )
-
-        # Remove extra spaces
-        normalized = " ".join(normalized.split())
-
-        return normalized
+        return _normalize_company_name(company_name)
 
     def _calculate_similarity(self, str1: str, str2: str) -> float:
         """Calculates similarity between two strings using Levenshtein distance"""
         if not str1 or not str2:
             return 0.0
 
+        if RAPIDFUZZ_AVAILABLE:
+            return Levenshtein.normalized_similarity(str1, str2)
+
         # Simple Levenshtein distance implementation
         def levenshtein_distance(s1, s2):
             if len(s1) < len(s2):
@@ -141,57 +204,134 @@ class CompanyFilter:
         Returns:
             tuple: (is_excluded: bool, matched_company: str, similarity_score: float)
         """
-        # Handle NaN or None values
+        # Handle NaN or None values; names shorter than 3 characters are
+        # never compared, so only longer excluded companies count
         if (
             not company_name
-            or not self.excluded_companies
+            or not self._fuzzy_choices
             or str(company_name).lower() in ["nan", "none", ""]
         ):
             return False, "", 0.0
 
         normalized_input = self._normalize_company_name(company_name)
+        input_length = len(normalized_input)
 
-        best_match = ""
-        best_similarity = 0.0
+        # Skip comparison for very short company names
+        if input_length < 3:
+            return False, "", 0.0
 
-        for excluded_company in self.excluded_companies:
-            excluded_normalized = excluded_company["normalized"]
-            excluded_original = excluded_company["original"]
+        # Direct match
+        matched_company = self._exact_matches.get(normalized_input)
+        if matched_company is not None:
+            return True, matched_company, 1.0
 
-            # Skip comparison for very short company names
-            if len(normalized_input) < 3 or len(excluded_normalized) < 3:
-                continue
+        best_match = ""
+        best_similarity = 0.0
 
-            # Direct match
-            if normalized_input == excluded_normalized:
-                return True, excluded_original, 1.0
+        hits = self._containment_hits(normalized_input)
 
-            # Partial match (one contains the other)
-            if (
-                normalized_input in excluded_normalized
-                or excluded_normalized in normalized_input
-            ):
-                # Calculate similarity for partial matches
-                similarity = max(
-                    len(normalized_input) / len(excluded_normalized),
-                    len(excluded_normalized) / len(normalized_input),
-                )
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_match = excluded_original
-
-            # Fuzzy match using Levenshtein distance
-            similarity = self._calculate_similarity(
-                normalized_input, excluded_normalized
+        # Partial match (one contains the other)
+        for index in hits:
+            excluded_length = len(self._fuzzy_choices[index])
+            # Calculate similarity for partial matches
+            similarity = max(
+                input_length / excluded_length,
+                excluded_length / input_length,
             )
             if similarity > best_similarity:
                 best_similarity = similarity
-                best_match = excluded_original
+                best_match = self._fuzzy_originals[index]
+
+        # Fuzzy match using Levenshtein distance - a partial match always
+        # scores above 1.0, so fuzzy scores only matter without one
+        if not best_match:
+            best_match, best_similarity = self._best_fuzzy_match(
+                normalized_input, similarity_threshold
+            )
 
         # Return True if similarity is above threshold
         is_excluded = best_similarity >= similarity_threshold
         return is_excluded, best_match, best_similarity
 
+    def _containment_hits(self, normalized_input: str) -> List[int]:
+        """Returns positions of excluded names that contain or are contained
+        in the input, in file order"""
+        hits = set()
+
+        # Excluded names inside the input
+        if self._automaton is not None:
+            for _, index in self._automaton.iter(normalized_input):
+                hits.add(index)
+        else:
+            hits.update(
+                index
+                for index, normalized in enumerate(self._fuzzy_choices)
+                if normalized in normalized_input
+            )
+
+        # Input inside excluded names
+        position = self._haystack.find(normalized_input)
+        while position != -1:
+            index = bisect.bisect_right(self._offsets, position) - 1
+            hits.add(index)
+            if index + 1 >= len(self._offsets):
+                break
+            position = self._haystack.find(
+                normalized_input, self._offsets[index + 1]
+            )
+
+        return sorted(hits)
+
+    def _length_window(
+        self, input_length: int, similarity_threshold: float
+    ) -> List[int]:
+        """Returns candidate positions whose length can reach the threshold"""
+        if similarity_threshold <= 0:
+            return list(range(len(self._fuzzy_choices)))
+
+        # The distance is at least the length difference, so longer or
+        # shorter names than the slack allows can never be similar enough
+        max_ratio = (1 - similarity_threshold) / similarity_threshold
+        slack = int(input_length * max_ratio) + 1
+        indices = []
+        for length in range(input_length - slack, input_length + slack + 1):
+            indices.extend(self._by_length.get(length, ()))
+        # Keep file order so ties resolve to the same company as before
+        indices.sort()
+        return indices
+
+    def _best_fuzzy_match(
+        self, normalized_input: str, similarity_threshold: float
+    ) -> Tuple[str, float]:
+        """Finds the most similar excluded company by Levenshtein similarity"""
+        indices = self._length_window(
+            len(normalized_input), similarity_threshold
+        )
+        if not indices:
+            return "", 0.0
+
+        if RAPIDFUZZ_AVAILABLE:
+            result = fuzz_process.extractOne(
+                normalized_input,
+                [self._fuzzy_choices[i] for i in indices],
+                scorer=Levenshtein.normalized_similarity,
+            )
+            if result is None:
+                return "", 0.0
+            _, similarity, position = result
+            return self._fuzzy_originals[indices[position]], similarity
+
+        best_match = ""
+        best_similarity = 0.0
+        for index in indices:
+            similarity = self._calculate_similarity(
+                normalized_input, self._fuzzy_choices[index]
+            )
+            if similarity > best_similarity:
+                best_similarity = similarity
+                best_match = self._fuzzy_originals[index]
+        return best_match, best_similarity
+
     def is_company_excluded(
         self, company_name: str, similarity_threshold: float = 0.8
     ) -> bool:
@@ -201,6 +341,62 @@ class CompanyFilter:
         )
         return is_excluded
 
+    def are_companies_excluded(
+        self, company_names: List[str], similarity_threshold: float = 0.8
+    ) -> List[bool]:
+        """Checks a batch of companies against the exclusion list at once"""
+        if not RAPIDFUZZ_AVAILABLE:
+            return [
+                self.is_company_excluded(company_name, similarity_threshold)
+                for company_name in company_names
+            ]
+
+        results = [False] * len(company_names)
+        # Names without a partial match still need fuzzy scoring
+        fuzzy_positions = []
+        fuzzy_inputs = []
+
+        for position, company_name in enumerate(company_names):
+            if (
+                not company_name
+                or not self._fuzzy_choices
+                or str(company_name).lower() in ["nan", "none", ""]
+            ):
+                continue
+
+            normalized_input = self._normalize_company_name(company_name)
+            if len(normalized_input) < 3:
+                continue
+
+            if self._containment_hits(normalized_input):
+                results[position] = True
+            else:
+                fuzzy_positions.append(position)
+                fuzzy_inputs.append(normalized_input)
+
+        if not fuzzy_inputs:
+            return results
+
+        if similarity_threshold <= 0:
+            for position in fuzzy_positions:
+                results[position] = True
+            return results
+
+        # One multithreaded call scores every input against every company;
+        # scores below the threshold come back as 0
+        scores = fuzz_process.cdist(
+            fuzzy_inputs,
+            self._fuzzy_choices,
+            scorer=Levenshtein.normalized_similarity,
+            score_cutoff=similarity_threshold,
+            workers=-1,
+        )
+        excluded_mask = scores.max(axis=1) > 0
+        for position, is_excluded in zip(fuzzy_positions, excluded_mask):
+            results[position] = bool(is_excluded)
+
+        return results
+
     def get_exclusion_details(
         self, company_name: str, similarity_threshold: float = 0.8
     ) -> Dict:
@@ -4,18 +4,187 @@ Data processing functionality for CSV handling, user data extraction, and filter
 
 import os
 import csv
+import functools
+import importlib.util
+import mmap
 import re
 import shutil
+import tempfile
+from collections import defaultdict
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Iterator, Optional, Any
+
+# pandas is only imported by the code paths that build DataFrames, see
+# _pandas(); callers that never touch one skip its import cost
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
+_pd = None
 
 try:
-    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
 
-    PANDAS_AVAILABLE = True
+    PYARROW_AVAILABLE = True
 except ImportError:
-    PANDAS_AVAILABLE = False
+    PYARROW_AVAILABLE = False
+
+# Columns read when extracting users: output fields plus filter inputs
+USER_EXTRACT_COLUMNS = [
+    "source_url",
+    "full_name",
+    "company_name",
+    "connected",
+    "Follow-up",
+    "valid",
+    "gaming_vertical",
+    "position",
+]
+
+# Rows per pandas chunk; filters run on each chunk as it is read
+CSV_CHUNK_SIZE = 100_000
+
+# Buffer size for open() on CSV files, 1 MiB instead of the 8 KiB default
+CSV_BUFFER_SIZE = 1 << 20
+
+# Text columns scanned by the pandas filters and user extraction
+ARROW_STRING_COLUMNS = [
+    "gaming_vertical",
+    "position",
+    "full_name",
+    "source_url",
+]
+
+# Cell values pandas reads as missing by default, for read-only scans
+CSV_NULL_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+POSITION_KEYWORDS = [
+    "chief executive officer",
+    "ceo",
+    "chief operating officer",
+    "coo",
+    "chief financial officer",
+    "cfo",
+    "chief payments officer",
+    "cpo",
+    "payments",
+    "psp",
+    "operations",
+    "business development",
+    "partnerships",
+    "relationship",
+    "country manager",
+]
+
+# User id in an attendee profile URL
+ATTENDEE_RE = re.compile(r"/attendees/([^/?]+)")
+
+# Positions are lowercased before matching; the pattern has no
+# lookarounds so Arrow's RE2 kernels can run it too
+POSITION_RE = re.compile("|".join(map(re.escape, POSITION_KEYWORDS)))
+
+KYIV_TZ = ZoneInfo("Europe/Kiev")
+
+# Cell values meaning a message or follow-up was sent
+SENT_VALUES = frozenset(("true", "yes", "1", "sent"))
+# Sent markers plus an empty cell, which counts as sent in older CSVs
+SENT_OR_EMPTY_VALUES = SENT_VALUES | {""}
+# Response Status values meaning no reply has been seen yet
+NO_RESPONSE_VALUES = frozenset(("", "no response", "false"))
+
+# Columns read for an author's follow-up campaign
+AUTHOR_FOLLOWUP_COLUMNS = (
+    "Author",
+    "Chat ID",
+    "Sent",
+    "Weekly Follow-up",
+    "Monthly Follow-up",
+    "First Name",
+    "Last Name",
+)
+
+# dd.mm.yyyy, the format follow_up_date is written in
+DOTTED_DATE_RE = re.compile(r"([0-9]{1,2})\.([0-9]{1,2})\.([0-9]{4})")
+
+# Date formats accepted by parse_date_flexible, keyed by date separator
+# and by whether a time part follows the date
+DATE_FORMATS = {
+    ("-", False): "%Y-%m-%d",
+    ("-", True): "%Y-%m-%d %H:%M:%S",
+    (".", False): "%d.%m.%Y",
+    (".", True): "%d.%m.%Y %H:%M:%S",
+    ("/", False): "%d/%m/%Y",
+}
+
+
+@functools.lru_cache(maxsize=200_000)
+def _extract_user_id(source_url: str) -> str:
+    """Extracts the attendee user_id from a source_url string
+
+    The same URLs come back on every run, so results are memoized.
+    """
+    match = ATTENDEE_RE.search(source_url)
+    return match.group(1) if match else ""
+
+
+def _pandas():
+    """Imports pandas on first use and returns the module"""
+    global _pd
+    if _pd is None:
+        import pandas
+
+        _pd = pandas
+    return _pd
+
+
+def _cell(row: list, index: int) -> str:
+    """Returns row[index] from a csv.reader row, "" if the column is missing"""
+    return row[index] if 0 <= index < len(row) else ""
+
+
+def _status_dtypes(columns) -> Dict[str, str]:
+    """read_csv dtype map: the given status columns as category, rest str"""
+    return defaultdict(lambda: str, dict.fromkeys(columns, "category"))
+
+
+def _status_in(column: "pd.Series", values: frozenset) -> "pd.Series":
+    """Tests stripped, lowercased cells of a status column against values
+
+    Status columns are read as category, so each distinct value is
+    normalized once and rows are matched by their integer codes. Missing
+    cells count as "".
+    """
+    if column.dtype.name != "category":
+        return column.fillna("").str.strip().str.lower().isin(values)
+    codes = column.cat.codes
+    allowed = [
+        code
+        for code, value in enumerate(column.cat.categories)
+        if value.strip().lower() in values
+    ]
+    if "" in values:
+        allowed.append(-1)
+    return codes.isin(allowed)
 
 
 class DataProcessor:
@@ -23,6 +192,190 @@ class DataProcessor:
 
     def __init__(self, data_dir: str):
         self.data_dir = data_dir
+        # DataFrames kept between update_csv_* calls, written back by flush()
+        self._df_cache = {}
+        self._df_mtimes = {}
+        self._dirty = set()
+        # user_id -> row labels of the cached DataFrames, built on demand
+        self._row_index = {}
+        # "Chat ID" -> row labels of the cached DataFrames, built on demand
+        self._chat_index = {}
+        # csv_file -> ((mtime_ns, size), chat IDs awaiting a response)
+        self._relevant_ids_cache = {}
+        # New rows kept as dicts and appended in one concat by flush()
+        self._pending_rows = {}
+        self._pending_users = {}
+
+    def _load_frame(self, csv_file: str):
+        """Returns the cached DataFrame for a CSV, reading it when needed"""
+        mtime = os.path.getmtime(csv_file)
+        if csv_file in self._df_cache and (
+            csv_file in self._dirty or self._df_mtimes.get(csv_file) == mtime
+        ):
+            return self._df_cache[csv_file]
+
+        df = self._read_frame(csv_file)
+        self._df_cache[csv_file] = df
+        self._df_mtimes[csv_file] = mtime
+        self._row_index.pop(csv_file, None)
+        self._chat_index.pop(csv_file, None)
+        return df
+
+    def _read_frame(self, csv_file: str):
+        """Reads a whole CSV with every column kept as strings
+
+        pyarrow's multithreaded parser is used when it is installed. Only
+        empty cells become missing: flush() rewrites the whole file, so
+        "NA", "None" or "null" must come back as they were read, just as
+        "true" does not turn into "True" or "1" into "1.0".
+        """
+        pd = _pandas()
+        if PYARROW_AVAILABLE:
+            try:
+                table = pa_csv.read_csv(
+                    csv_file,
+                    parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                    convert_options=self._arrow_convert_options(
+                        self._csv_headers(csv_file), null_values=[""]
+                    ),
+                )
+                return table.to_pandas()
+            except Exception:
+                # pandas reports the problem if the file is malformed
+                pass
+        return pd.read_csv(
+            csv_file, dtype=str, keep_default_na=False, na_values=[""]
+        )
+
+    def _csv_headers(self, csv_file: str) -> List[str]:
+        """Returns the header row of a CSV file"""
+        with open(csv_file, "r", encoding="utf-8-sig", newline="") as f:
+            return next(csv.reader(f), [])
+
+    def _arrow_convert_options(self, columns: List[str], **options):
+        """Arrow convert options reading columns as strings, NaN like pandas
+
+        Pass null_values=[""] for frames that are written back to disk.
+        """
+        options.setdefault("null_values", CSV_NULL_VALUES)
+        return pa_csv.ConvertOptions(
+            column_types={c: pa.string() for c in columns},
+            strings_can_be_null=True,
+            **options,
+        )
+
+    def _user_rows(self, csv_file: str, df) -> Dict[str, List[int]]:
+        """Returns the user_id -> row labels map for a cached DataFrame"""
+        index = self._row_index.get(csv_file)
+        if index is None:
+            index = {}
+            if "source_url" in df.columns:
+                user_ids = (
+                    df["source_url"]
+                    .astype(str)
+                    .str.extract(ATTENDEE_RE, expand=False)
+                )
+                for label, user_id in zip(df.index, user_ids.to_numpy()):
+                    if isinstance(user_id, str):
+                        index.setdefault(user_id, []).append(label)
+            self._row_index[csv_file] = index
+        return index
+
+    def _chat_rows(self, csv_file: str, df) -> Dict[str, List[int]]:
+        """Returns the "Chat ID" -> row labels map for a cached DataFrame"""
+        index = self._chat_index.get(csv_file)
+        if index is None:
+            index = {}
+            if "Chat ID" in df.columns:
+                for label, value in zip(df.index, df["Chat ID"].to_numpy()):
+                    if isinstance(value, str):
+                        index.setdefault(value, []).append(label)
+            self._chat_index[csv_file] = index
+        return index
+
+    def _chat_row(self, csv_file: str, df, chat_id: str):
+        """Returns the first row label for a "Chat ID" value, or None"""
+        labels = self._chat_rows(csv_file, df).get(chat_id)
+        return labels[0] if labels else None
+
+    def _append_row(self, csv_file: str, row: Dict[str, str]):
+        """Queues a new row for a cached CSV until the next flush()"""
+        self._pending_rows.setdefault(csv_file, []).append(row)
+        user_id = self.extract_user_id_from_url(row.get("source_url"))
+        if user_id:
+            users = self._pending_users.setdefault(csv_file, {})
+            users.setdefault(user_id, []).append(row)
+        self._dirty.add(csv_file)
+
+    def _pending_rows_with(self, csv_file: str, column: str, value) -> list:
+        """Returns queued rows whose column equals the given value"""
+        return [
+            row
+            for row in self._pending_rows.get(csv_file, [])
+            if row.get(column) == value
+        ]
+
+    def _fold_pending_rows(self, csv_file: str):
+        """Appends all queued rows to the cached DataFrame at once"""
+        pd = _pandas()
+        rows = self._pending_rows.pop(csv_file, None)
+        self._pending_users.pop(csv_file, None)
+        if not rows:
+            return
+
+        df = self._df_cache[csv_file]
+        start = len(df)
+        df = pd.concat([df, pd.DataFrame(rows)], ignore_index=True)
+        self._df_cache[csv_file] = df
+        self._chat_index.pop(csv_file, None)
+
+        index = self._row_index.get(csv_file)
+        if index is not None:
+            for label, row in enumerate(rows, start):
+                user_id = self.extract_user_id_from_url(row.get("source_url"))
+                if user_id:
+                    index.setdefault(user_id, []).append(label)
+
+    def _store_frame(self, csv_file: str, df):
+        """Keeps an updated DataFrame in memory until the next flush()"""
+        self._df_cache[csv_file] = df
+        self._dirty.add(csv_file)
+
+    @staticmethod
+    def _ensure_columns(df, columns):
+        """Returns df with any missing columns appended, filled with ""
+
+        All missing columns are added by one reindex instead of one
+        insert each; df is returned unchanged if nothing is missing.
+        """
+        missing = [column for column in columns if column not in df.columns]
+        if not missing:
+            return df
+        return df.reindex(columns=[*df.columns, *missing], fill_value="")
+
+    def flush(self, csv_file: str = None):
+        """Writes pending CSV updates to disk (all files if none is given)"""
+        files = [csv_file] if csv_file else list(self._dirty)
+        for path in files:
+            if path not in self._dirty:
+                continue
+            self._fold_pending_rows(path)
+            self.write_csv_atomic(self._df_cache[path], path)
+            self._df_mtimes[path] = os.path.getmtime(path)
+            self._dirty.discard(path)
+
+    def write_csv_atomic(self, df, csv_file: str):
+        """Writes a DataFrame next to the CSV and swaps it in with os.replace
+
+        A crash during the write leaves the previous file intact.
+        """
+        tmp_file = f"{csv_file}.tmp"
+        try:
+            df.to_csv(tmp_file, index=False, encoding="utf-8")
+            os.replace(tmp_file, csv_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
 
     def extract_user_data_from_csv(
         self,
@@ -37,24 +390,49 @@ class DataProcessor:
             print(f"❌ Файл {csv_file} не знайдено")
             return user_data
 
+        # Pending updates must be on disk before the file is read again
+        self.flush(csv_file)
+
+        if PYARROW_AVAILABLE:
+            try:
+                user_data = self._extract_users_arrow(
+                    csv_file, apply_filters, enable_position_filter
+                )
+                print(
+                    f"📋 Знайдено {len(user_data)} користувачів для обробки"
+                )
+                return user_data
+            except Exception as e:
+                print(
+                    f"⚠️ Помилка читання CSV через pyarrow ({e}), пробуємо pandas..."
+                )
+
         try:
             if PANDAS_AVAILABLE:
+                pd = _pandas()
                 # Read CSV file with more tolerant settings
                 try:
-                    df = pd.read_csv(csv_file, encoding="utf-8")
-                    print(f"📊 Загальна кількість записів: {len(df)}")
+                    df, total, stage_counts = self._read_filtered_frame(
+                        csv_file,
+                        apply_filters,
+                        enable_position_filter,
+                        encoding="utf-8",
+                    )
+                    print(f"📊 Загальна кількість записів: {total}")
                 except pd.errors.ParserError as e:
                     print(f"⚠️ Помилка парсингу CSV (спробуємо виправити): {e}")
                     # Try with other parameters
                     try:
-                        df = pd.read_csv(
+                        df, total, stage_counts = self._read_filtered_frame(
                             csv_file,
+                            apply_filters,
+                            enable_position_filter,
                             encoding="utf-8",
                             quoting=1,
                             skipinitialspace=True,
                         )
                         print(
-                            f"📊 Загальна кількість записів (після виправлення): {len(df)}"
+                            f"📊 Загальна кількість записів (після виправлення): {total}"
                         )
                     except Exception as e2:
                         print(f"❌ Критична помилка парсингу CSV: {e2}")
@@ -65,22 +443,29 @@ class DataProcessor:
                         "⚠️ Помилка кодування, спробуємо з іншим кодуванням..."
                     )
                     try:
-                        df = pd.read_csv(csv_file, encoding="latin-1")
+                        df, total, stage_counts = self._read_filtered_frame(
+                            csv_file,
+                            apply_filters,
+                            enable_position_filter,
+                            encoding="latin-1",
+                        )
                         print(
-                            f"📊 Загальна кількість записів (latin-1): {len(df)}"
+                            f"📊 Загальна кількість записів (latin-1): {total}"
                         )
                     except Exception as e3:
                         print(f"❌ Помилка з усіма кодуваннями: {e3}")
                         raise ImportError("Fallback to basic CSV processing")
 
                 if apply_filters:
-                    df = self._apply_pandas_filters(df, enable_position_filter)
+                    self._print_filter_summary(
+                        list(df.columns),
+                        enable_position_filter,
+                        total,
+                        stage_counts,
+                    )
 
                 # Convert to user list
-                for _, row in df.iterrows():
-                    user_info = self._extract_user_from_row(row)
-                    if user_info:
-                        user_data.append(user_info)
+                user_data = self._extract_users_from_frame(df)
             else:
                 raise ImportError("pandas not available")
 
@@ -93,139 +478,317 @@ class DataProcessor:
         print(f"📋 Знайдено {len(user_data)} користувачів для обробки")
         return user_data
 
-    def _apply_pandas_filters(self, df, enable_position_filter: bool):
-        """Apply filters using pandas"""
-        print("🔍 Застосовуємо фільтри...")
-        original_count = len(df)
+    def _read_filtered_frame(
+        self,
+        csv_file: str,
+        apply_filters: bool,
+        enable_position_filter: bool,
+        **read_options,
+    ):
+        """Reads the CSV with pandas in chunks, filtering each chunk
+
+        Only the rows that pass the filters are kept, so peak memory is
+        bounded by one chunk. Returns the kept rows, the total row count
+        and the rows left after each filter stage.
+        """
+        pd = _pandas()
+        chunks = []
+        total = 0
+        # Rows left after each filter stage, summed over all chunks
+        stage_counts = {}
+
+        # Only the needed columns are parsed, all as strings, so no time
+        # goes into type inference and empty cells compare the same way
+        # in every chunk
+        for chunk in pd.read_csv(
+            csv_file,
+            chunksize=CSV_CHUNK_SIZE,
+            dtype=str,
+            usecols=lambda column: column in USER_EXTRACT_COLUMNS,
+            **read_options,
+        ):
+            total += len(chunk)
+            if PYARROW_AVAILABLE:
+                chunk = self._to_arrow_strings(chunk)
+            if apply_filters:
+                chunk = self._apply_pandas_filters(
+                    chunk, enable_position_filter, stage_counts
+                )
+            chunks.append(chunk)
 
-        # 1. Filter by empty 'connected' field (if column exists)
-        if "connected" in df.columns:
-            df = df[df["connected"].isna() | (df["connected"] == "")]
-            print(f"   Після фільтру 'connected' (порожнє): {len(df)} записів")
-        else:
-            print(f"   Колонка 'connected' не знайдена, пропускаємо фільтр")
+        df = pd.concat(chunks, ignore_index=True)
+        return df, total, stage_counts
 
-        # 2. Filter by empty 'Follow-up' field (if column exists)
-        if "Follow-up" in df.columns:
-            df = df[df["Follow-up"].isna() | (df["Follow-up"] == "")]
-            print(f"   Після фільтру 'Follow-up' (порожнє): {len(df)} записів")
-        else:
-            print(f"   Колонка 'Follow-up' не знайдена, пропускаємо фільтр")
+    def _extract_users_arrow(
+        self, csv_file: str, apply_filters: bool, enable_position_filter: bool
+    ) -> List[Dict[str, str]]:
+        """Streams the CSV in record batches and filters them with Arrow
+
+        Only the needed columns are decoded, and the filters mirror
+        _apply_pandas_filters, so memory stays bounded by the batch size.
+        """
+        headers = self._csv_headers(csv_file)
+        columns = [c for c in USER_EXTRACT_COLUMNS if c in headers]
+
+        reader = pa_csv.open_csv(
+            csv_file,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=self._arrow_convert_options(
+                columns, include_columns=columns
+            ),
+        )
 
-        # 3. Filter by 'valid' field - exclude records with valid="false"
-        if "valid" in df.columns:
-            before_valid_filter = len(df)
-            df = df[df["valid"] != "false"]
-            excluded_by_valid = before_valid_filter - len(df)
-            print(
-                f"   Після фільтру 'valid' (виключено invalid): {len(df)} записів (-{excluded_by_valid} invalid)"
-            )
-        else:
-            print(f"   Колонка 'valid' не знайдена, пропускаємо фільтр")
+        user_data = []
+        total = 0
+        # Rows left after each filter stage, summed over all batches
+        stage_counts = {}
+
+        for batch in reader:
+            total += batch.num_rows
+            if apply_filters:
+                batch = self._filter_arrow_batch(
+                    batch, enable_position_filter, stage_counts
+                )
 
-        # 4. Filter by gaming_vertical (without "land")
-        if "gaming_vertical" in df.columns:
-            df = df[
-                ~df["gaming_vertical"].str.contains(
-                    "land", case=False, na=False
+            def column(name):
+                if name in batch.schema.names:
+                    return batch.column(name).to_pylist()
+                return [None] * batch.num_rows
+
+            for source_url, full_name, company_name in zip(
+                column("source_url"),
+                column("full_name"),
+                column("company_name"),
+            ):
+                user_info = self._extract_user_from_data(
+                    source_url or "", full_name or "", company_name or ""
                 )
-            ]
-            print(
-                f"   Після фільтру gaming_vertical (без 'land'): {len(df)} записів"
+                if user_info:
+                    user_data.append(user_info)
+
+        print(f"📊 Загальна кількість записів: {total}")
+        if apply_filters:
+            self._print_filter_summary(
+                columns, enable_position_filter, total, stage_counts
             )
 
-        # 5. Filter by position (contains keywords) - only if enabled
-        if enable_position_filter:
-            df = self._apply_position_filter(df)
-        else:
-            print("   Фільтр за позиціями вимкнено - включені всі позиції")
+        return user_data
 
-        print(f"📊 Відфільтровано: {original_count} → {len(df)} записів")
-        return df
+    def _filter_arrow_batch(
+        self, batch, enable_position_filter: bool, stage_counts: Dict
+    ):
+        """Applies the extraction filters to one Arrow record batch"""
+        names = batch.schema.names
+
+        def keep(stage, mask):
+            nonlocal batch
+            batch = batch.filter(mask)
+            stage_counts[stage] = stage_counts.get(stage, 0) + batch.num_rows
+
+        # 1-2. Empty 'connected' and 'Follow-up' fields
+        for name in ("connected", "Follow-up"):
+            if name in names:
+                keep(name, pc.is_null(batch.column(name)))
+
+        # 3. Exclude records with valid="false"
+        if "valid" in names:
+            valid = batch.column("valid")
+            keep(
+                "valid",
+                pc.fill_null(pc.not_equal(valid, "false"), True),
+            )
 
-    def _apply_position_filter(self, df):
-        """Apply position-based filtering"""
-        position_keywords = [
-            "chief executive officer",
-            "ceo",
-            "chief operating officer",
-            "coo",
-            "chief financial officer",
-            "cfo",
-            "chief payments officer",
-            "cpo",
-            "payments",
-            "psp",
-            "operations",
-            "business development",
-            "partnerships",
-            "relationship",
-            "country manager",
-        ]
+        # 4. gaming_vertical without "land"
+        if "gaming_vertical" in names:
+            has_land = pc.match_substring(
+                batch.column("gaming_vertical"), "land", ignore_case=True
+            )
+            keep("gaming_vertical", pc.invert(pc.fill_null(has_land, False)))
+
+        # 5. Position keywords, excluding COO coordinators
+        if enable_position_filter and "position" in names:
+            position = pc.fill_null(batch.column("position"), "")
+            has_keyword = pc.match_substring_regex(
+                position, POSITION_RE.pattern, ignore_case=True
+            )
+            is_coo_coordinator = pc.and_(
+                pc.match_substring(position, "coo", ignore_case=True),
+                pc.match_substring(position, "coordinator", ignore_case=True),
+            )
+            keep("position", pc.and_not(has_keyword, is_coo_coordinator))
 
-        if "position" in df.columns:
-            # Convert positions to lowercase for comparison
-            df["position_lower"] = df["position"].str.lower().fillna("")
+        return batch
+
+    def _print_filter_summary(
+        self, columns, enable_position_filter, total, stage_counts
+    ):
+        """Prints the filter report from the per-stage row counts
+
+        The lines are collected and written with a single print call.
+        """
+        lines = ["🔍 Застосовуємо фільтри..."]
+        count = total
+
+        for name in ("connected", "Follow-up"):
+            if name in columns:
+                count = stage_counts.get(name, 0)
+                lines.append(
+                    f"   Після фільтру '{name}' (порожнє): {count} записів"
+                )
+            else:
+                lines.append(
+                    f"   Колонка '{name}' не знайдена, пропускаємо фільтр"
+                )
+
+        if "valid" in columns:
+            before_valid_filter = count
+            count = stage_counts.get("valid", 0)
+            lines.append(
+                f"   Після фільтру 'valid' (виключено invalid): {count} записів (-{before_valid_filter - count} invalid)"
+            )
+        else:
+            lines.append(f"   Колонка 'valid' не знайдена, пропускаємо фільтр")
 
-            # Create mask for positions containing keywords
-            position_mask = df["position_lower"].str.contains(
-                "|".join(position_keywords), case=False, na=False
+        if "gaming_vertical" in columns:
+            count = stage_counts.get("gaming_vertical", 0)
+            lines.append(
+                f"   Після фільтру gaming_vertical (без 'land'): {count} записів"
             )
 
-            # Exclude "coordinator" for COO
-            coordinator_mask = df["position_lower"].str.contains(
-                "coordinator", case=False, na=False
+        if not enable_position_filter:
+            lines.append(
+                "   Фільтр за позиціями вимкнено - включені всі позиції"
             )
-            coo_mask = df["position_lower"].str.contains(
-                "coo", case=False, na=False
+        elif "position" in columns:
+            count = stage_counts.get("position", 0)
+            lines.append(
+                f"   Після фільтру позиції (ключові слова, виключаючи COO+coordinator): {count} записів"
             )
 
-            # Apply filter: include positions with keywords, but exclude coordinator with COO
-            df = df[position_mask & ~(coo_mask & coordinator_mask)]
+        lines.append(f"📊 Відфільтровано: {total} → {count} записів")
+        print("\n".join(lines))
 
-            # Remove temporary column
-            df = df.drop("position_lower", axis=1)
+    def _to_arrow_strings(self, df):
+        """Stores the scanned text columns as Arrow strings
 
-            print(
-                f"   Після фільтру позиції (ключові слова, виключаючи COO+coordinator): {len(df)} записів"
+        str.contains, str.lower and str.split then run as Arrow compute
+        kernels instead of Python loops over object arrays.
+        """
+        for column in ARROW_STRING_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype("string[pyarrow]")
+        return df
+
+    def _apply_pandas_filters(
+        self, df, enable_position_filter: bool, stage_counts: Dict
+    ):
+        """Apply filters using pandas, counting rows left after each stage"""
+        pd = _pandas()
+
+        def count(stage, rows):
+            stage_counts[stage] = stage_counts.get(stage, 0) + int(rows)
+
+        # Masks are combined first so the frame is copied only once
+        mask = pd.Series(True, index=df.index)
+
+        # 1-2. Filter by empty 'connected' and 'Follow-up' fields
+        for name in ("connected", "Follow-up"):
+            if name in df.columns:
+                mask &= df[name].isna() | (df[name] == "")
+                count(name, mask.sum())
+
+        # 3. Filter by 'valid' field - exclude records with valid="false"
+        if "valid" in df.columns:
+            mask &= df["valid"] != "false"
+            count("valid", mask.sum())
+
+        # 4. Filter by gaming_vertical (without "land")
+        if "gaming_vertical" in df.columns:
+            # Lowercased once, then a plain substring test instead of a
+            # case-insensitive regex
+            mask &= ~df["gaming_vertical"].str.lower().str.contains(
+                "land", regex=False, na=False
             )
+            count("gaming_vertical", mask.sum())
 
-        return df
+        # 5. Filter by position (contains keywords) - only if enabled
+        if enable_position_filter and "position" in df.columns:
+            mask &= self._position_mask(df)
+            count("position", mask.sum())
 
-    def _extract_user_from_row(self, row) -> Optional[Dict[str, str]]:
-        """Extract user information from a pandas row"""
-        source_url = row.get("source_url", "")
-        full_name = row.get("full_name", "")
-        company_name = row.get("company_name", "")
+        return df[mask]
 
-        if source_url and full_name:
-            # Extract user ID from URL
-            match = re.search(r"/attendees/([^/?]+)", source_url)
-            if match:
-                user_id = match.group(1)
+    def _position_mask(self, df):
+        """Mask of positions with keywords, excluding COO coordinators"""
+        # Convert positions to lowercase for comparison
+        positions = df["position"].str.lower().fillna("")
 
-                # Extract first name
-                first_name = (
-                    full_name.split()[0] if full_name.split() else "there"
-                )
+        # Create mask for positions containing keywords
+        position_mask = positions.str.contains(POSITION_RE.pattern, na=False)
 
-                return {
-                    "user_id": user_id,
-                    "first_name": first_name,
-                    "full_name": full_name,
-                    "company_name": company_name,
-                }
-        return None
+        # Exclude "coordinator" for COO
+        coo_coordinator_mask = positions.str.contains(
+            "coo", regex=False, na=False
+        ) & positions.str.contains("coordinator", regex=False, na=False)
+
+        return position_mask & ~coo_coordinator_mask
+
+    def _extract_users_from_frame(self, df) -> List[Dict[str, str]]:
+        """Extract user information from a DataFrame column by column"""
+        pd = _pandas()
+        if "source_url" not in df.columns or "full_name" not in df.columns:
+            return []
+
+        df = df[df["source_url"].notna() & df["full_name"].notna()]
+        full_names = df["full_name"].astype(str)
+
+        # Extract user ID from URL
+        user_ids = (
+            df["source_url"]
+            .astype(str)
+            .str.extract(ATTENDEE_RE, expand=False)
+        )
+
+        # Extract first name
+        first_names = full_names.str.split(n=1).str[0].fillna("there")
+
+        if "company_name" in df.columns:
+            company_names = df["company_name"].fillna("")
+        else:
+            company_names = pd.Series("", index=df.index)
+
+        return [
+            {
+                "user_id": user_id,
+                "first_name": first_name,
+                "full_name": full_name,
+                "company_name": company_name,
+            }
+            for user_id, first_name, full_name, company_name in zip(
+                user_ids.to_numpy(),
+                first_names.to_numpy(),
+                full_names.to_numpy(),
+                company_names.to_numpy(),
+            )
+            if isinstance(user_id, str)
+        ]
 
     def _process_csv_basic(self, csv_file: str) -> List[Dict[str, str]]:
         """Process CSV using basic file operations when pandas isn't available"""
         user_data = []
 
         try:
-            with open(csv_file, "r", encoding="utf-8") as f:
+            with open(
+                csv_file,
+                "r",
+                encoding="utf-8",
+                newline="",
+                buffering=CSV_BUFFER_SIZE,
+            ) as f:
+                reader = csv.reader(f)
+
                 # First read headers
-                first_line = f.readline().strip()
-                headers = first_line.split(",")
+                headers = [h.strip() for h in next(reader, [])]
 
                 # Check if required columns exist
                 if "source_url" not in headers or "full_name" not in headers:
@@ -242,40 +805,29 @@ class DataProcessor:
                     else -1
                 )
 
-                line_num = 1
-                for line in f:
-                    line_num += 1
-                    line = line.strip()
-                    if not line:
+                # Check if enough fields
+                max_idx = max(source_url_idx, full_name_idx)
+
+                for line_num, fields in enumerate(reader, 2):
+                    if len(fields) <= max_idx:
                         continue
 
                     try:
-                        # Simple split by comma (may not work perfectly, but better than nothing)
-                        fields = line.split(",")
-
-                        # Check if enough fields
-                        max_idx = max(source_url_idx, full_name_idx)
-                        if company_name_idx > -1:
-                            max_idx = max(max_idx, company_name_idx)
-
-                        if len(fields) > max_idx:
-                            source_url = (
-                                fields[source_url_idx].strip().strip('"')
-                            )
-                            full_name = (
-                                fields[full_name_idx].strip().strip('"')
-                            )
-                            company_name = (
-                                fields[company_name_idx].strip().strip('"')
-                                if -1 < company_name_idx < len(fields)
-                                else ""
-                            )
+                        # csv.reader already unquotes fields and keeps
+                        # quoted commas inside them
+                        source_url = fields[source_url_idx].strip()
+                        full_name = fields[full_name_idx].strip()
+                        company_name = (
+                            fields[company_name_idx].strip()
+                            if -1 < company_name_idx < len(fields)
+                            else ""
+                        )
 
-                            user_info = self._extract_user_from_data(
-                                source_url, full_name, company_name
-                            )
-                            if user_info:
-                                user_data.append(user_info)
+                        user_info = self._extract_user_from_data(
+                            source_url, full_name, company_name
+                        )
+                        if user_info:
+                            user_data.append(user_info)
                     except Exception as line_error:
                         print(
                             f"⚠️ Пропускаємо пошкоджений рядок {line_num}: {str(line_error)[:50]}..."
@@ -294,14 +846,13 @@ class DataProcessor:
         """Extract user information from raw data"""
         if source_url and full_name:
             # Extract user ID from URL
-            match = re.search(r"/attendees/([^/?]+)", source_url)
+            match = ATTENDEE_RE.search(source_url)
             if match:
                 user_id = match.group(1)
 
-                # Extract first name
-                first_name = (
-                    full_name.split()[0] if full_name.split() else "there"
-                )
+                # Extract first name, splitting the name only once
+                name_parts = full_name.split(maxsplit=1)
+                first_name = name_parts[0] if name_parts else "there"
 
                 return {
                     "user_id": user_id,
@@ -316,13 +867,24 @@ class DataProcessor:
         user_data = []
         try:
             # Try with different encoding
-            with open(csv_file, "r", encoding="latin-1") as f:
-                reader = csv.DictReader(f)
+            with open(
+                csv_file, "r", encoding="latin-1", buffering=CSV_BUFFER_SIZE
+            ) as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                idx = {name: i for i, name in enumerate(header)}
+                source_url_i = idx.get("source_url", -1)
+                full_name_i = idx.get("full_name", -1)
+                company_name_i = idx.get("company_name", -1)
+
                 for row_num, row in enumerate(reader, 2):
+                    # Blank lines carry no record
+                    if not row:
+                        continue
                     try:
-                        source_url = row.get("source_url", "")
-                        full_name = row.get("full_name", "")
-                        company_name = row.get("company_name", "")
+                        source_url = _cell(row, source_url_i)
+                        full_name = _cell(row, full_name_i)
+                        company_name = _cell(row, company_name_i)
 
                         user_info = self._extract_user_from_data(
                             source_url, full_name, company_name
@@ -343,11 +905,8 @@ class DataProcessor:
         """Extracts user_id from source_url"""
         if not source_url:
             return ""
-        try:
-            match = re.search(r"/attendees/([^/?]+)", source_url)
-            return match.group(1) if match else ""
-        except:
-            return ""
+        # str() also makes NaN and other cells hashable cache keys
+        return _extract_user_id(str(source_url))
 
     def parse_date_flexible(self, date_str, current_date) -> datetime:
         """Flexible date parsing in various formats"""
@@ -367,33 +926,37 @@ class DataProcessor:
         if not date_str:
             return current_date
 
-        kyiv_tz = ZoneInfo("Europe/Kiev")
+        # Pick the single format matching the separator instead of trying
+        # every format and catching ValueError
+        separator = next((c for c in "-./" if c in date_str), None)
+        fmt = DATE_FORMATS.get((separator, " " in date_str))
+        if not fmt:
+            return None
 
         try:
-            # Try multiple date formats
-            for fmt in [
-                "%Y-%m-%d",
-                "%d.%m.%Y",
-                "%d/%m/%Y",
-                "%Y-%m-%d %H:%M:%S",
-                "%d.%m.%Y %H:%M:%S",
-            ]:
+            dotted = DOTTED_DATE_RE.fullmatch(date_str)
+            if dotted:
+                day, month, year = map(int, dotted.groups())
+                parsed_date = datetime(year, month, day)
+            elif separator == "-":
+                # ISO dates parse much faster than with strptime
                 try:
-                    parsed_date = datetime.strptime(date_str, fmt)
-                    # If no timezone, assume Kyiv
-                    if parsed_date.tzinfo is None:
-                        parsed_date = parsed_date.replace(tzinfo=kyiv_tz)
-                    return parsed_date
+                    parsed_date = datetime.fromisoformat(date_str)
                 except ValueError:
-                    continue
-
-        except Exception:
-            pass
+                    parsed_date = datetime.strptime(date_str, fmt)
+            else:
+                parsed_date = datetime.strptime(date_str, fmt)
+        except ValueError:
+            return None
 
-        return None
+        # If no timezone, assume Kyiv
+        if parsed_date.tzinfo is None:
+            parsed_date = parsed_date.replace(tzinfo=KYIV_TZ)
+        return parsed_date
 
     def fix_malformed_csv(self, csv_file: str, backup: bool = True) -> bool:
         """Fixes malformed CSV file"""
+        self.flush(csv_file)
         if backup:
             backup_file = f"{csv_file}.backup"
             try:
@@ -402,65 +965,84 @@ class DataProcessor:
             except Exception as e:
                 print(f"⚠️ Не вдалося створити backup: {e}")
 
+        tmp_file = None
         try:
-            fixed_rows = []
-
-            with open(csv_file, "r", encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
-
-            if not lines:
-                print("❌ Файл порожній")
-                return False
+            with open(
+                csv_file, "r", encoding="utf-8", errors="replace", newline=""
+            ) as fin, tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                newline="",
+                delete=False,
+                dir=os.path.dirname(os.path.abspath(csv_file)),
+                suffix=".tmp",
+            ) as fout:
+                tmp_file = fout.name
+                reader = csv.reader(fin)
+                writer = csv.writer(fout, lineterminator="\n")
+
+                # First line - headers
+                headers = next(reader, None)
+                if not headers:
+                    print("❌ Файл порожній")
+                    return False
+
+                headers = [h.strip() for h in headers]
+                expected_fields = len(headers)
 
-            # First line - headers
-            header_line = lines[0].strip()
-            headers = [h.strip().strip('"') for h in header_line.split(",")]
-            expected_fields = len(headers)
+                print(
+                    f"📊 Очікується {expected_fields} полів на рядок\n"
+                    f"📋 Заголовки: {', '.join(headers[:5])}..."
+                )
 
-            print(f"📊 Очікується {expected_fields} полів на рядок")
-            print(f"📋 Заголовки: {', '.join(headers[:5])}...")
+                writer.writerow(headers)
+                written_rows = 1
+                # Per-line reports, printed together after the loop
+                messages = []
 
-            fixed_rows.append(header_line)
+                for line_num, fields in enumerate(reader, 2):
+                    if not fields:
+                        continue
 
-            for line_num, line in enumerate(lines[1:], 2):
-                line = line.strip()
-                if not line:
-                    continue
+                    if len(fields) == expected_fields:
+                        # Line is correct
+                        writer.writerow(fields)
+                    elif len(fields) > expected_fields:
+                        # Too many fields - possibly unprotected commas in data
+                        messages.append(
+                            f"⚠️ Рядок {line_num}: {len(fields)} полів замість {expected_fields}"
+                        )
 
-                # Count fields
-                fields = line.split(",")
+                        # Try to keep only first required fields
+                        writer.writerow(fields[:expected_fields])
+                        messages.append(f"✅ Виправлено рядок {line_num}")
+                    else:
+                        # Too few fields - skip
+                        messages.append(
+                            f"❌ Пропускаємо рядок {line_num}: тільки {len(fields)} полів"
+                        )
+                        continue
 
-                if len(fields) == expected_fields:
-                    # Line is correct
-                    fixed_rows.append(line)
-                elif len(fields) > expected_fields:
-                    # Too many fields - possibly unprotected commas in data
-                    print(
-                        f"⚠️ Рядок {line_num}: {len(fields)} полів замість {expected_fields}"
-                    )
+                    written_rows += 1
 
-                    # Try to keep only first required fields
-                    fixed_line = ",".join(fields[:expected_fields])
-                    fixed_rows.append(fixed_line)
-                    print(f"✅ Виправлено рядок {line_num}")
-                else:
-                    # Too few fields - skip
-                    print(
-                        f"❌ Пропускаємо рядок {line_num}: тільки {len(fields)} полів"
-                    )
-                    continue
+                if messages:
+                    print("\n".join(messages))
 
-            # Write fixed CSV
-            with open(csv_file, "w", encoding="utf-8") as f:
-                f.write("\n".join(fixed_rows))
+            # Replace the original only once the fixed copy is complete
+            os.replace(tmp_file, csv_file)
+            tmp_file = None
 
-            print(f"✅ Виправлено CSV файл: {len(fixed_rows)} рядків")
+            print(f"✅ Виправлено CSV файл: {written_rows} рядків")
             return True
 
         except Exception as e:
             print(f"❌ Помилка виправлення CSV: {e}")
             return False
 
+        finally:
+            if tmp_file and os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
     def update_csv_with_messaging_status(
         self, csv_file: str, user_id: str, full_name: str, chat_id: str = None
     ):
@@ -550,18 +1132,32 @@ class DataProcessor:
         chat_id: str = None,
     ):
         """Helper method to update CSV using pandas"""
-        df = pd.read_csv(csv_file)
+        df = self._load_frame(csv_file)
 
         # Try to find existing record
-        user_mask = df["source_url"].str.contains(
-            f"/attendees/{user_id}", na=False
-        )
+        rows = self._user_rows(csv_file, df).get(str(user_id))
+        pending = self._pending_users.get(csv_file, {}).get(str(user_id))
+
+        # Only a real change marks the file for rewriting on flush()
+        changed = False
 
-        if user_mask.any():
+        if rows or pending:
             # Update existing record
-            df.loc[user_mask, column] = value
-            if chat_id and "chat_id" in df.columns:
-                df.loc[user_mask, "chat_id"] = chat_id
+            if rows:
+                updates = {column: value}
+                if chat_id and "chat_id" in df.columns:
+                    updates["chat_id"] = chat_id
+                for name, new_value in updates.items():
+                    if (
+                        name not in df.columns
+                        or (df.loc[rows, name] != new_value).any()
+                    ):
+                        df.loc[rows, name] = new_value
+                        changed = True
+            for row in pending or []:
+                row[column] = value
+                if chat_id and ("chat_id" in df.columns or "chat_id" in row):
+                    row["chat_id"] = chat_id
         else:
             # Create new record if needed
             if full_name:
@@ -573,24 +1169,27 @@ class DataProcessor:
                 if chat_id:
                     new_row["chat_id"] = chat_id
 
-                # Convert to DataFrame and append
-                new_df = pd.DataFrame([new_row])
-                df = pd.concat([df, new_df], ignore_index=True)
+                self._append_row(csv_file, new_row)
 
-        df.to_csv(csv_file, index=False)
+        if changed:
+            self._store_frame(csv_file, df)
 
     def _update_csv_followup_pandas(
         self, csv_file: str, chat_id: str, followup_type: str
     ):
         """Helper method to update follow-up status using pandas"""
-        df = pd.read_csv(csv_file)
+        df = self._load_frame(csv_file)
 
         # Find records with matching chat_id
+        for row in self._pending_rows_with(csv_file, "chat_id", chat_id):
+            row["Follow-up"] = followup_type
         if "chat_id" in df.columns:
             chat_mask = df["chat_id"] == chat_id
+            if "Follow-up" in df.columns:
+                chat_mask &= df["Follow-up"] != followup_type
             if chat_mask.any():
                 df.loc[chat_mask, "Follow-up"] = followup_type
-                df.to_csv(csv_file, index=False)
+                self._store_frame(csv_file, df)
 
     def create_csv_row_for_participant(
         self, csv_file: str, user_id: str, participant_name: str, chat_id: str
@@ -598,7 +1197,8 @@ class DataProcessor:
         """Creates new row in CSV for participant who wasn't in initial database"""
         try:
             if PANDAS_AVAILABLE:
-                df = pd.read_csv(csv_file)
+                # Reads the CSV into the cache the queued row is added to
+                self._load_frame(csv_file)
 
                 new_row = {
                     "source_url": f"https://sbcconnect.com/attendees/{user_id}",
@@ -609,9 +1209,7 @@ class DataProcessor:
                 }
 
                 # Add row
-                new_df = pd.DataFrame([new_row])
-                df = pd.concat([df, new_df], ignore_index=True)
-                df.to_csv(csv_file, index=False)
+                self._append_row(csv_file, new_row)
 
                 print(f"✅ Створено новий рядок для {participant_name}")
                 return True
@@ -626,20 +1224,41 @@ class DataProcessor:
         self, csv_file: str, chat_id: str, followup_type: str
     ) -> bool:
         """Checks if followup has been sent according to CSV"""
+        followup_column = f"{followup_type.title()} Follow-up"
         try:
-            with open(csv_file, "r", encoding="utf-8", newline="") as file:
-                reader = csv.DictReader(file)
+            if PANDAS_AVAILABLE:
+                # Looked up in the cached frame instead of rescanning the file
+                df = self._load_frame(csv_file)
+                label = self._chat_row(csv_file, df, chat_id)
+                if label is None or followup_column not in df.columns:
+                    return False
+                followup_status = df.at[label, followup_column]
+                if not isinstance(followup_status, str):
+                    return False
+                return followup_status.strip().lower() in SENT_VALUES
+
+            self.flush(csv_file)
+            with open(
+                csv_file,
+                "r",
+                encoding="utf-8",
+                newline="",
+                buffering=CSV_BUFFER_SIZE,
+            ) as file:
+                reader = csv.reader(file)
+                header = next(reader, [])
+                if "Chat ID" not in header:
+                    return False
+                chat_i = header.index("Chat ID")
+                followup_i = (
+                    header.index(followup_column)
+                    if followup_column in header
+                    else -1
+                )
                 for row in reader:
-                    if row.get("Chat ID") == chat_id:
-                        followup_status = row.get(
-                            f"{followup_type.title()} Follow-up", ""
-                        ).strip()
-                        return followup_status.lower() in [
-                            "true",
-                            "yes",
-                            "1",
-                            "sent",
-                        ]
+                    if chat_i < len(row) and row[chat_i] == chat_id:
+                        followup_status = _cell(row, followup_i).strip()
+                        return followup_status.lower() in SENT_VALUES
             return False
         except Exception as e:
             print(f"❌ Помилка перевірки follow-up в CSV: {e}")
@@ -654,17 +1273,17 @@ class DataProcessor:
     ):
         """Оновлює статус Follow-up в CSV файлі після відправки з підтримкою conference_active та створення нових записів"""
         try:
-            import pandas as pd
-            from zoneinfo import ZoneInfo
-            from datetime import datetime
+            if not PANDAS_AVAILABLE:
+                raise ImportError("pandas not available")
 
-            df = pd.read_csv(csv_file)
+            df = self._load_frame(csv_file)
 
-            # Спочатку шукаємо запис за chat_id
-            mask = df["chat_id"] == chat_id
+            # Спочатку шукаємо запис за chat_id (також серед нових рядків)
+            rows = df.index[df["chat_id"] == chat_id].tolist()
+            pending = self._pending_rows_with(csv_file, "chat_id", chat_id)
             found_row = False
 
-            if mask.any():
+            if rows or pending:
                 found_row = True
                 print(f"       📋 Знайдено запис за chat_id: {chat_id}")
             else:
@@ -699,11 +1318,13 @@ class DataProcessor:
 
                     if participant_id:
                         # Шукаємо за source_url, що містить цей user_id
-                        source_mask = df["source_url"].str.contains(
-                            participant_id, na=False
+                        rows = self._user_rows(csv_file, df).get(
+                            str(participant_id), []
                         )
-                        if source_mask.any():
-                            mask = source_mask
+                        pending = self._pending_users.get(csv_file, {}).get(
+                            str(participant_id), []
+                        )
+                        if rows or pending:
                             found_row = True
                             print(
                                 f"       ✅ Знайдено запис за user_id: {participant_id}"
@@ -726,72 +1347,60 @@ class DataProcessor:
                                 "chat_id": chat_id,
                             }
 
-                            # Додаємо новий рядок до DataFrame
-                            new_df = pd.DataFrame([new_row])
-                            df = pd.concat([df, new_df], ignore_index=True)
-
-                            # Оновлюємо mask для нового рядка
-                            mask = df.index == (len(df) - 1)
+                            # Додаємо новий рядок (до DataFrame - під час flush)
+                            self._append_row(csv_file, new_row)
+                            pending = [new_row]
                             found_row = True
                             print(
                                 f"       ✅ Створено новий запис для {participant_name}"
                             )
 
             if found_row:
+                # Значення поточного типу з першого знайденого запису
+                if rows:
+                    current_type = (
+                        df.at[rows[0], "Follow-up type"]
+                        if "Follow-up type" in df.columns
+                        else ""
+                    )
+                else:
+                    current_type = pending[0].get("Follow-up type", "")
+
                 # Handle different followup types appropriately
                 if followup_type == "conference_active":
-                    # For conference active messages, use dedicated column
-                    if "Conference Active Status" not in df.columns:
-                        df["Conference Active Status"] = ""
-                    df.loc[mask, "Conference Active Status"] = "sent"
-
-                    # Also set the general Follow-up status
-                    df.loc[mask, "Follow-up"] = "true"
-
-                    # Update chat_id if it was missing
-                    if "chat_id" not in df.columns:
-                        df["chat_id"] = ""
-                    df.loc[mask, "chat_id"] = chat_id
+                    # For conference active messages, use dedicated column,
+                    # also set the general Follow-up status and chat_id
+                    updates = {
+                        "Conference Active Status": "sent",
+                        "Follow-up": "true",
+                        "chat_id": chat_id,
+                    }
 
                     # Update Follow-up type column to include conference_active
-                    if "Follow-up type" not in df.columns:
-                        df["Follow-up type"] = ""
-                    current_type = df.loc[mask, "Follow-up type"].iloc[0]
-                    if pd.isna(current_type) or str(current_type) == "":
-                        df.loc[mask, "Follow-up type"] = "conference_active"
-                    elif "conference_active" not in str(current_type):
-                        df.loc[mask, "Follow-up type"] = (
-                            f"{current_type},conference_active"
-                        )
+                    updates["Follow-up type"] = self._add_followup_type(
+                        current_type, "conference_active"
+                    )
                 else:
                     # For other followup types, use the standard logic
-                    df.loc[mask, "Follow-up"] = "true"
-
-                    # Update chat_id if it was missing
-                    if "chat_id" not in df.columns:
-                        df["chat_id"] = ""
-                    df.loc[mask, "chat_id"] = chat_id
-
-                    # Оновлюємо Follow-up type колонку
-                    if "Follow-up type" not in df.columns:
-                        df["Follow-up type"] = ""
-                    df.loc[mask, "Follow-up type"] = (
-                        f"follow-up_{followup_type}"
-                    )
+                    updates = {
+                        "Follow-up": "true",
+                        "chat_id": chat_id,
+                        "Follow-up type": f"follow-up_{followup_type}",
+                    }
 
                 # ВАЖЛИВО: Записуємо дату відправки follow-up
-                kyiv_tz = ZoneInfo("Europe/Kiev")
-                current_date = datetime.now(kyiv_tz)
-                formatted_date = current_date.strftime("%d.%m.%Y")
-
-                # Додаємо колонку follow_up_date якщо її немає
-                if "follow_up_date" not in df.columns:
-                    df["follow_up_date"] = ""
+                formatted_date = datetime.now(KYIV_TZ).strftime("%d.%m.%Y")
+                updates["follow_up_date"] = formatted_date
 
-                df.loc[mask, "follow_up_date"] = formatted_date
+                if rows:
+                    # Додаємо відсутні колонки та оновлюємо всі за один раз
+                    df = self._ensure_columns(df, updates)
+                    df.loc[rows, list(updates)] = list(updates.values())
+                for row in pending:
+                    row.update(updates)
 
-                # Зберігаємо оновлений файл
-                df.to_csv(csv_file, index=False, encoding="utf-8")
+                # Зберігаємо оновлений файл (на диск - під час flush)
+                self._store_frame(csv_file, df)
 
                 print(
                     f"       📝 Follow-up статус оновлено: {followup_type}, дата: {formatted_date}"
@@ -815,6 +1424,101 @@ class DataProcessor:
             traceback.print_exc()
             return False
 
+    def _add_followup_type(self, current_type, followup_type: str) -> str:
+        """Adds a type to a Follow-up type value
+
+        Types are kept as a sorted comma-separated set, so repeated updates
+        do not grow the value.
+        """
+        pd = _pandas()
+        followup_types = set()
+        if not pd.isna(current_type):
+            followup_types.update(t for t in str(current_type).split(",") if t)
+        followup_types.add(followup_type)
+        return ",".join(sorted(followup_types))
+
+    def update_csv_followup_status_bulk(
+        self, csv_file: str, updates: Dict[str, str]
+    ) -> int:
+        """Marks follow-ups as sent for many chats at once
+
+        updates maps chat_id to followup_type. Rows are matched by chat_id
+        only and get the same values as update_csv_followup_status, in one
+        vectorized pass. Returns the number of chats found.
+        """
+        if not updates:
+            return 0
+
+        try:
+            if not PANDAS_AVAILABLE:
+                raise ImportError("pandas not available")
+
+            df = self._load_frame(csv_file)
+            formatted_date = datetime.now(KYIV_TZ).strftime("%d.%m.%Y")
+            found = set()
+
+            # Rows queued since the last flush
+            for row in self._pending_rows.get(csv_file, []):
+                followup_type = updates.get(row.get("chat_id"))
+                if followup_type is None:
+                    continue
+                found.add(row["chat_id"])
+                row["Follow-up"] = "true"
+                row["follow_up_date"] = formatted_date
+                if followup_type == "conference_active":
+                    row["Conference Active Status"] = "sent"
+                    row["Follow-up type"] = self._add_followup_type(
+                        row.get("Follow-up type", ""), followup_type
+                    )
+                else:
+                    row["Follow-up type"] = f"follow-up_{followup_type}"
+
+            if "chat_id" in df.columns:
+                # followup_type per row, NaN where the chat is not updated
+                row_types = df["chat_id"].map(updates)
+                mask = row_types.notna()
+
+                if mask.any():
+                    found.update(df.loc[mask, "chat_id"])
+                    df = self._ensure_columns(
+                        df, ("Follow-up type", "follow_up_date", "Follow-up")
+                    )
+                    df.loc[mask, ["Follow-up", "follow_up_date"]] = [
+                        "true",
+                        formatted_date,
+                    ]
+
+                    conference = mask & (row_types == "conference_active")
+                    regular = mask & ~conference
+                    df.loc[regular, "Follow-up type"] = (
+                        "follow-up_" + row_types[regular]
+                    )
+                    if conference.any():
+                        if "Conference Active Status" not in df.columns:
+                            df["Conference Active Status"] = ""
+                        df.loc[conference, "Conference Active Status"] = "sent"
+                        df.loc[conference, "Follow-up type"] = df.loc[
+                            conference, "Follow-up type"
+                        ].map(
+                            lambda current_type: self._add_followup_type(
+                                current_type, "conference_active"
+                            )
+                        )
+
+                    self._store_frame(csv_file, df)
+
+            print(
+                f"📝 Follow-up статус оновлено для {len(found)} з {len(updates)} чатів, дата: {formatted_date}"
+            )
+            return len(found)
+
+        except ImportError:
+            print("⚠️ pandas не встановлено, Follow-up статус не оновлено")
+            return 0
+        except Exception as e:
+            print(f"❌ Помилка оновлення Follow-up статусів: {e}")
+            return 0
+
     def update_csv_response_status_by_chat_id(
         self,
         csv_file: str,
@@ -825,144 +1529,462 @@ class DataProcessor:
     ) -> bool:
         """Updates CSV response status by Chat ID"""
         try:
-            # Read current CSV
-            rows = []
-            updated = False
+            if PANDAS_AVAILABLE:
+                # Rows come from the Chat ID index instead of a column
+                # scan; the cached frame is written on flush()
+                df = self._load_frame(csv_file)
+                rows = self._chat_rows(csv_file, df).get(chat_id)
+                if not rows:
+                    return False
+
+                updates = {
+                    "Response Status": (
+                        "Response" if has_response else "No Response"
+                    )
+                }
+                if has_response:
+                    updates["Response Date"] = datetime.now().strftime(
+                        "%Y-%m-%d %H:%M:%S"
+                    )
+                if participant_name:
+                    updates["Participant Name"] = participant_name
+
+                # Ensure required columns exist
+                columns = ["Response Status", "Response Date", *updates]
+                df = self._ensure_columns(df, dict.fromkeys(columns))
+                df.loc[rows, list(updates)] = list(updates.values())
+                self._store_frame(csv_file, df)
+
+                print(f"✅ Оновлено статус відповіді для Chat ID: {chat_id}")
+                return True
+
+            self.flush(csv_file)
+            # A raw byte search rules out most misses without parsing
+            if not self._file_contains(csv_file, chat_id):
+                return False
+            return self._stream_response_status_update(
+                csv_file, chat_id, has_response, participant_name
+            )
+        except Exception as e:
+            print(f"❌ Помилка оновлення статусу відповіді: {e}")
+            return False
 
-            with open(csv_file, "r", encoding="utf-8", newline="") as file:
-                reader = csv.DictReader(file)
-                fieldnames = reader.fieldnames
+    @staticmethod
+    def _file_contains(csv_file: str, text: str) -> bool:
+        """Checks whether text occurs anywhere in the file's bytes
+
+        Matches in any column or inside quotes, so a False is definitive
+        while a True still has to be confirmed by parsing.
+        """
+        if not text:
+            return False
+        with open(csv_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(text.encode("utf-8")) != -1
+
+    def _stream_response_status_update(
+        self,
+        csv_file: str,
+        chat_id: str,
+        has_response: bool,
+        participant_name: str = None,
+    ) -> bool:
+        """Rewrites the CSV row by row into a temp file, then swaps it in
+
+        Memory stays constant; the original is replaced only if a row
+        matched the Chat ID.
+        """
+        updated = False
+        status = "Response" if has_response else "No Response"
+        response_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        tmp_file = f"{csv_file}.tmp"
+
+        try:
+            with open(
+                csv_file,
+                "r",
+                encoding="utf-8",
+                newline="",
+                buffering=CSV_BUFFER_SIZE,
+            ) as fin, open(
+                tmp_file,
+                "w",
+                encoding="utf-8",
+                newline="",
+                buffering=CSV_BUFFER_SIZE,
+            ) as fout:
+                reader = csv.reader(fin)
+                fieldnames = next(reader, [])
 
                 # Ensure required columns exist
                 required_columns = ["Response Status", "Response Date"]
+                if participant_name:
+                    required_columns.append("Participant Name")
                 for col in required_columns:
                     if col not in fieldnames:
-                        fieldnames = list(fieldnames) + [col]
+                        fieldnames.append(col)
+
+                # The schema is fixed before the loop, so cells are set by
+                # index and rows are written as the lists they were read as
+                width = len(fieldnames)
+                idx = {name: i for i, name in enumerate(fieldnames)}
+                chat_i = idx.get("Chat ID", -1)
+                cell_updates = [(idx["Response Status"], status)]
+                if has_response:
+                    cell_updates.append((idx["Response Date"], response_date))
+                if participant_name:
+                    cell_updates.append(
+                        (idx["Participant Name"], participant_name)
+                    )
 
-                for row in reader:
-                    if row.get("Chat ID") == chat_id:
-                        row["Response Status"] = (
-                            "Response" if has_response else "No Response"
-                        )
-                        if has_response:
-                            from datetime import datetime
+                writer = csv.writer(fout)
+                writer.writerow(fieldnames)
 
-                            row["Response Date"] = datetime.now().strftime(
-                                "%Y-%m-%d %H:%M:%S"
-                            )
-                        if participant_name:
-                            if "Participant Name" not in fieldnames:
-                                fieldnames = list(fieldnames) + [
-                                    "Participant Name"
-                                ]
-                            row["Participant Name"] = participant_name
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < width:
+                        row.extend([""] * (width - len(row)))
+                    if _cell(row, chat_i) == chat_id:
+                        for index, value in cell_updates:
+                            row[index] = value
                         updated = True
-                    rows.append(row)
+                    writer.writerow(row)
 
             if updated:
-                # Write updated CSV
-                with open(csv_file, "w", encoding="utf-8", newline="") as file:
-                    writer = csv.DictWriter(file, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(rows)
-
+                os.replace(tmp_file, csv_file)
                 print(f"✅ Оновлено статус відповіді для Chat ID: {chat_id}")
 
             return updated
-        except Exception as e:
-            print(f"❌ Помилка оновлення статусу відповіді: {e}")
-            return False
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
 
     def _get_relevant_chat_ids_from_csv(self, csv_file: str) -> set:
         """Gets chat IDs that need response checking (Sent/Empty/True status)"""
-        relevant_chat_ids = set()
         try:
-            with open(csv_file, "r", encoding="utf-8", newline="") as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    # Check if message was sent and no response yet
-                    sent_status = row.get("Sent", "").strip().lower()
-                    response_status = (
-                        row.get("Response Status", "").strip().lower()
-                    )
-                    chat_id = row.get("Chat ID", "").strip()
-
-                    if chat_id and sent_status in [
-                        "true",
-                        "yes",
-                        "1",
-                        "sent",
-                        "",
-                    ]:
-                        if not response_status or response_status in [
-                            "",
-                            "no response",
-                            "false",
-                        ]:
-                            relevant_chat_ids.add(chat_id)
-
+            self.flush(csv_file)
+            # Any write changes mtime or size, so a matching key means the
+            # file has not changed since the last scan
+            stat = os.stat(csv_file)
+            key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._relevant_ids_cache.get(csv_file)
+            if cached is None or cached[0] != key:
+                chat_ids = frozenset(self._scan_relevant_chat_ids(csv_file))
+                cached = (key, chat_ids)
+                self._relevant_ids_cache[csv_file] = cached
+            return set(cached[1])
         except Exception as e:
             print(f"❌ Помилка читання CSV для фільтрації: {e}")
+            return set()
+
+    def _scan_relevant_chat_ids(self, csv_file: str) -> set:
+        """Reads the chat IDs awaiting a response from the CSV file"""
+        if PANDAS_AVAILABLE:
+            return self._relevant_chat_ids_pandas(csv_file)
+
+        relevant_chat_ids = set()
+        with open(
+            csv_file,
+            "r",
+            encoding="utf-8",
+            newline="",
+            buffering=CSV_BUFFER_SIZE,
+        ) as file:
+            reader = csv.reader(file)
+            idx = {name: i for i, name in enumerate(next(reader, []))}
+            chat_i = idx.get("Chat ID", -1)
+            sent_i = idx.get("Sent", -1)
+            resp_i = idx.get("Response Status", -1)
+            for row in reader:
+                # Check if message was sent and no response yet
+                sent_status = _cell(row, sent_i).strip().lower()
+                response_status = _cell(row, resp_i).strip().lower()
+                chat_id = _cell(row, chat_i).strip()
+
+                if (
+                    chat_id
+                    and sent_status in SENT_OR_EMPTY_VALUES
+                    and response_status in NO_RESPONSE_VALUES
+                ):
+                    relevant_chat_ids.add(chat_id)
 
         return relevant_chat_ids
 
+    def _relevant_chat_ids_pandas(self, csv_file: str) -> set:
+        """Selects chat IDs awaiting a response with vectorized masks"""
+        pd = _pandas()
+        columns = ("Chat ID", "Sent", "Response Status")
+        df = pd.read_csv(
+            csv_file,
+            usecols=lambda name: name in columns,
+            dtype=_status_dtypes(columns[1:]),
+            keep_default_na=False,
+            encoding="utf-8",
+        )
+        if "Chat ID" not in df.columns:
+            return set()
+
+        chat_ids = df["Chat ID"].fillna("").str.strip()
+        mask = chat_ids != ""
+        # A missing status column reads as empty, which both sets accept
+        if "Sent" in df.columns:
+            mask &= _status_in(df["Sent"], SENT_OR_EMPTY_VALUES)
+        if "Response Status" in df.columns:
+            mask &= _status_in(df["Response Status"], NO_RESPONSE_VALUES)
+        return set(chat_ids[mask])
+
     def get_followup_candidates_from_csv(
         self, csv_file: str, followup_type: str, check_columns: list = None
     ) -> list:
         """Gets candidates for follow-up campaigns from CSV"""
-        candidates = []
+        return list(
+            self.iter_followup_candidates(
+                csv_file, followup_type, check_columns
+            )
+        )
 
+    def iter_followup_candidates(
+        self, csv_file: str, followup_type: str, check_columns: list = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yields candidates for follow-up campaigns from CSV one by one
+
+        The file is parsed as the caller iterates, so a caller that stops
+        after enough candidates skips the rest of it; the file is closed
+        when the generator is.
+        """
         if check_columns is None:
             check_columns = ["Sent"]
 
+        followup_column = f"{followup_type.title()} Follow-up"
+
         try:
-            with open(csv_file, "r", encoding="utf-8", newline="") as file:
-                reader = csv.DictReader(file)
+            self.flush(csv_file)
+            if PANDAS_AVAILABLE:
+                yield from self._iter_followup_candidates_pandas(
+                    csv_file, followup_column, check_columns
+                )
+                return
+
+            with open(
+                csv_file,
+                "r",
+                encoding="utf-8",
+                newline="",
+                buffering=CSV_BUFFER_SIZE,
+            ) as file:
+                reader = csv.reader(file)
+                header = next(reader, [])
+                idx = {name: i for i, name in enumerate(header)}
+                chat_i = idx.get("Chat ID", -1)
+                followup_i = idx.get(followup_column, -1)
+                check_is = [idx[col] for col in check_columns if col in idx]
 
                 for row in reader:
-                    chat_id = row.get("Chat ID", "").strip()
+                    chat_id = _cell(row, chat_i).strip()
                     if not chat_id:
                         continue
 
-                    # Check if eligible for this followup type
-                    eligible = True
-
                     # Check if already sent this followup
-                    followup_column = f"{followup_type.title()} Follow-up"
-                    if followup_column in row:
-                        followup_status = (
-                            row.get(followup_column, "").strip().lower()
-                        )
-                        if followup_status in ["true", "yes", "1", "sent"]:
-                            eligible = False
+                    followup_status = _cell(row, followup_i).strip().lower()
+                    if followup_status in SENT_VALUES:
+                        continue
 
                     # Check required conditions
-                    if eligible:
-                        for col in check_columns:
-                            if col in row:
-                                value = row.get(col, "").strip().lower()
-                                if value not in [
-                                    "true",
-                                    "yes",
-                                    "1",
-                                    "sent",
-                                    "",
-                                ]:
-                                    eligible = False
-                                    break
-
-                    if eligible:
-                        candidate = {
-                            "chat_id": chat_id,
-                            "first_name": row.get("First Name", ""),
-                            "last_name": row.get("Last Name", ""),
-                            "email": row.get("Email", ""),
-                            "company": row.get("Company", ""),
-                            "row_data": row,
-                        }
-                        candidates.append(candidate)
+                    if any(
+                        _cell(row, i).strip().lower()
+                        not in SENT_OR_EMPTY_VALUES
+                        for i in check_is
+                    ):
+                        continue
+
+                    # The row dict is only built for actual candidates
+                    row_data = dict(zip(header, row))
+                    yield {
+                        "chat_id": chat_id,
+                        "first_name": row_data.get("First Name", ""),
+                        "last_name": row_data.get("Last Name", ""),
+                        "email": row_data.get("Email", ""),
+                        "company": row_data.get("Company", ""),
+                        "row_data": row_data,
+                    }
 
         except Exception as e:
             print(f"❌ Помилка отримання кандидатів для follow-up: {e}")
 
-        return candidates
+    def _iter_followup_candidates_pandas(
+        self, csv_file: str, followup_column: str, check_columns: list
+    ) -> Iterator[Dict[str, Any]]:
+        """Selects follow-up candidates chunk by chunk with vectorized masks"""
+        pd = _pandas()
+        # Cells are read verbatim, as csv.DictReader would return them
+        chunks = pd.read_csv(
+            csv_file,
+            dtype=_status_dtypes([followup_column, *check_columns]),
+            keep_default_na=False,
+            encoding="utf-8",
+            chunksize=CSV_CHUNK_SIZE,
+        )
+        with chunks:
+            for df in chunks:
+                if "Chat ID" not in df.columns:
+                    return
+
+                chat_ids = df["Chat ID"].astype(object).fillna("").str.strip()
+                eligible = chat_ids != ""
+
+                # Not sent this followup yet
+                if followup_column in df.columns:
+                    eligible &= ~_status_in(df[followup_column], SENT_VALUES)
+
+                # Required conditions
+                for col in check_columns:
+                    if col in df.columns:
+                        eligible &= _status_in(df[col], SENT_OR_EMPTY_VALUES)
+
+                # Only the selected rows are turned into plain string dicts
+                rows = df[eligible].astype(object).fillna("")
+                for chat_id, row in zip(
+                    chat_ids[eligible], rows.to_dict("records")
+                ):
+                    yield {
+                        "chat_id": chat_id,
+                        "first_name": row.get("First Name", ""),
+                        "last_name": row.get("Last Name", ""),
+                        "email": row.get("Email", ""),
+                        "company": row.get("Company", ""),
+                        "row_data": row,
+                    }
+
+    def iter_author_followup_rows(
+        self, csv_file: str, author_name: str, counts: Dict[str, int]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yields rows of one author that have a chat and a sent first message
+
+        Each row carries whether the weekly and monthly follow-ups are
+        already marked sent. Rows read and rows of the author are added
+        to counts["total_checked"] and counts["matching_author"].
+        """
+        self.flush(csv_file)
+        if PANDAS_AVAILABLE:
+            yield from self._iter_author_followup_rows_pandas(
+                csv_file, author_name, counts
+            )
+            return
+
+        with open(
+            csv_file,
+            "r",
+            encoding="utf-8",
+            newline="",
+            buffering=CSV_BUFFER_SIZE,
+        ) as file:
+            reader = csv.reader(file)
+            header = next(reader, [])
+            idx = {name: i for i, name in enumerate(header)}
+            author_i, chat_i, sent_i, weekly_i, monthly_i, first_i, last_i = (
+                idx.get(name, -1) for name in AUTHOR_FOLLOWUP_COLUMNS
+            )
+
+            # Plain local counters in the per-row loop, added to counts
+            # once the file is read or the caller stops
+            total = matching = 0
+            try:
+                for total, row in enumerate(reader, 1):
+                    if _cell(row, author_i).strip() != author_name:
+                        continue
+                    matching += 1
+
+                    chat_id = _cell(row, chat_i).strip()
+                    if not chat_id:
+                        continue
+                    sent = _cell(row, sent_i).strip().lower()
+                    if sent not in SENT_VALUES:
+                        continue
+
+                    name = f"{_cell(row, first_i)} {_cell(row, last_i)}"
+                    weekly = _cell(row, weekly_i).strip().lower()
+                    monthly = _cell(row, monthly_i).strip().lower()
+                    yield {
+                        "chat_id": chat_id,
+                        "participant_name": name.strip(),
+                        "weekly_sent": weekly in SENT_VALUES,
+                        "monthly_sent": monthly in SENT_VALUES,
+                    }
+            finally:
+                counts["total_checked"] += total
+                counts["matching_author"] += matching
+
+    def _iter_author_followup_rows_pandas(
+        self, csv_file: str, author_name: str, counts: Dict[str, int]
+    ) -> Iterator[Dict[str, Any]]:
+        """Selects an author's follow-up rows chunk by chunk with masks"""
+        pd = _pandas()
+        with open(csv_file, "r", encoding="utf-8-sig", newline="") as file:
+            header = next(csv.reader(file), [])
+        # Without any known column every row would be dropped, and the
+        # rows still have to be counted
+        usecols = [c for c in AUTHOR_FOLLOWUP_COLUMNS if c in header] or None
+
+        chunks = pd.read_csv(
+            csv_file,
+            usecols=usecols,
+            dtype=_status_dtypes(
+                ("Sent", "Weekly Follow-up", "Monthly Follow-up")
+            ),
+            keep_default_na=False,
+            encoding="utf-8",
+            chunksize=CSV_CHUNK_SIZE,
+        )
+        with chunks:
+            for df in chunks:
+                counts["total_checked"] += len(df)
+                if "Author" not in df.columns:
+                    continue
+
+                authors = df["Author"].astype(object).fillna("").str.strip()
+                eligible = authors == author_name
+                counts["matching_author"] += int(eligible.sum())
+
+                if "Chat ID" not in df.columns or "Sent" not in df.columns:
+                    continue
+                chat_ids = df["Chat ID"].astype(object).fillna("").str.strip()
+                eligible &= chat_ids != ""
+                eligible &= _status_in(df["Sent"], SENT_VALUES)
+                if not eligible.any():
+                    continue
+
+                selected = df[eligible]
+                names = selected.reindex(
+                    columns=["First Name", "Last Name"], fill_value=""
+                )
+                names = names.astype(object).fillna("")
+                participant_names = (
+                    names["First Name"] + " " + names["Last Name"]
+                ).str.strip()
+
+                followups_sent = {}
+                for column in ("Weekly Follow-up", "Monthly Follow-up"):
+                    if column in selected.columns:
+                        followups_sent[column] = _status_in(
+                            selected[column], SENT_VALUES
+                        )
+                    else:
+                        followups_sent[column] = pd.Series(
+                            False, index=selected.index
+                        )
+
+                for chat_id, name, weekly_sent, monthly_sent in zip(
+                    chat_ids[eligible],
+                    participant_names,
+                    followups_sent["Weekly Follow-up"],
+                    followups_sent["Monthly Follow-up"],
+                ):
+                    yield {
+                        "chat_id": chat_id,
+                        "participant_name": name,
+                        "weekly_sent": bool(weekly_sent),
+                        "monthly_sent": bool(monthly_sent),
+                    }
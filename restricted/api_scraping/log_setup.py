@@ -0,0 +1,34 @@
+"""
+Console logging shared by every entry point of the scraper
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+
+def setup_logging(verbose=False):
+    """Routes log records through a queue so worker threads never block on stdout
+
+    Returns the listener, which must be stopped on exit to flush the queue.
+    """
+    log_queue = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(logging.DEBUG if verbose else logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, console)
+    listener.start()
+    return listener
+
+
+def ensure_logging():
+    """Installs the console handler unless the entry point configured logging"""
+    if logging.getLogger().handlers:
+        return
+    atexit.register(setup_logging().stop)
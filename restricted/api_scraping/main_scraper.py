@@ -3,10 +3,13 @@ Main scraper class that orchestrates all components and contains the menu system
 """
 
 import csv
+import itertools
 import os
 import sys
-import random
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from typing import Dict, List, Any
@@ -31,18 +34,81 @@ sys.path.append(
 from extract_contacts import ContactExtractor
 from .base_scraper import BaseScraper
 from .company_filter import CompanyFilter
-from .data_processor import DataProcessor
+from .data_processor import (
+    ATTENDEE_RE,
+    CSV_BUFFER_SIZE,
+    DataProcessor,
+)
+from .log_setup import ensure_logging
 from .messaging import MessagingHandler
 
+# Columns written for new attendees, in format_attendee_for_csv order
+ATTENDEE_CSV_FIELDS = (
+    "source_url",
+    "full_name",
+    "company_name",
+    "position",
+    "email",
+    "phone",
+    "gaming_vertical",
+    "organization_type",
+    "connected",
+    "Follow-up",
+    "author",
+    "Date",
+    "valid",
+    "Responded",
+    "chat_id",
+)
+
+# Console line and counter key for each send_message_to_user result;
+# anything else counts as a failed send
+SEND_RESULT_MESSAGES = {
+    "success": "✅ Повідомлення відправлено",
+    "already_contacted": "⏭️ Пропущено (чат вже має повідомлення)",
+    "excluded_company": "🚫 Пропущено (компанія виключена)",
+    "failed": "❌ Помилка відправки",
+}
+
+# Next follow-up for an author's contact, keyed by whether the weekly and
+# monthly follow-ups are already sent; weekly goes first, None means done
+NEXT_AUTHOR_FOLLOWUP = {
+    (False, False): "weekly",
+    (False, True): "weekly",
+    (True, False): "monthly",
+    (True, True): None,
+}
+
+# New attendee rows written between flushes of the CSV file
+ATTENDEE_FLUSH_ROWS = 50
+
+# Concurrent user detail requests when the transport is thread-safe
+USER_DETAILS_WORKERS = 6
+# Minimum spacing between user detail request starts, across all workers
+USER_DETAILS_INTERVAL = 0.5
+
 
 class SBCAttendeesScraper:
     """Main class that orchestrates the SBC attendees scraping and messaging system"""
 
-    def __init__(self, headless=True, proxy_config: Dict[str, str] = None):
+    def __init__(
+        self,
+        headless=True,
+        proxy_config: Dict[str, str] = None,
+        refresh_cache: bool = False,
+    ):
+        # Scripts that skip setup_logging would otherwise drop INFO records
+        ensure_logging()
+
         # Initialize core components
-        self.base_scraper = BaseScraper(headless, proxy_config)
-        self.company_filter = CompanyFilter(self.base_scraper.get_data_dir())
-        self.data_processor = DataProcessor(self.base_scraper.get_data_dir())
+        self.base_scraper = BaseScraper(
+            headless, proxy_config, refresh_cache=refresh_cache
+        )
+        # The data folder is fixed relative to the package, resolve it once
+        self._data_dir = self.base_scraper.get_data_dir()
+        self._default_csv = os.path.join(self._data_dir, "SBC - Attendees.csv")
+        self.company_filter = CompanyFilter(self._data_dir)
+        self.data_processor = DataProcessor(self._data_dir)
         self.messaging = MessagingHandler(
             self.base_scraper, self.company_filter, self.data_processor
         )
@@ -307,7 +373,7 @@ class SBCAttendeesScraper:
             return
 
         # CSV file selection
-        data_dir = self.base_scraper.get_data_dir()
+        data_dir = self._data_dir
         csv_files = []
         if os.path.exists(data_dir):
             for file in os.listdir(data_dir):
@@ -322,8 +388,10 @@ class SBCAttendeesScraper:
             file_path = os.path.join(data_dir, file)
             try:
                 with open(file_path, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    count = sum(1 for row in reader)
+                    reader = csv.reader(f)
+                    # Header and blank lines are not contacts
+                    next(reader, None)
+                    count = sum(1 for row in reader if row)
                 print(f"   {i}. {file} ({count} contacts)")
             except:
                 print(f"   {i}. {file} (unable to read)")
@@ -555,14 +623,8 @@ class SBCAttendeesScraper:
         # Застосовуємо ліміт користувачів якщо вказано
         if user_limit and user_limit > 0:
             if len(user_data) > user_limit:
+                original_count = len(user_data)
                 user_data = user_data[:user_limit]
-                original_count = len(
-                    self.data_processor.extract_user_data_from_csv(
-                        csv_file,
-                        apply_filters=True,
-                        enable_position_filter=enable_position_filter,
-                    )
-                )
                 print(
                     f"🔢 Застосовано ліміт: оброблятимемо {user_limit} з {original_count} доступних користувачів"
                 )
@@ -655,14 +717,8 @@ class SBCAttendeesScraper:
         # Застосовуємо ліміт користувачів якщо вказано
         if user_limit and user_limit > 0:
             if len(user_data) > user_limit:
+                original_count = len(user_data)
                 user_data = user_data[:user_limit]
-                original_count = len(
-                    self.data_processor.extract_user_data_from_csv(
-                        csv_file,
-                        apply_filters=True,
-                        enable_position_filter=enable_position_filter,
-                    )
-                )
                 print(
                     f"🔢 Застосовано ліміт: оброблятимемо {user_limit} з {original_count} доступних користувачів"
                 )
@@ -756,14 +812,8 @@ class SBCAttendeesScraper:
         # Застосовуємо ліміт користувачів якщо вказано
         if user_limit and user_limit > 0:
             if len(user_data) > user_limit:
+                original_count = len(user_data)
                 user_data = user_data[:user_limit]
-                original_count = len(
-                    self.data_processor.extract_user_data_from_csv(
-                        csv_file,
-                        apply_filters=True,
-                        enable_position_filter=enable_position_filter,
-                    )
-                )
                 print(
                     f"🔢 Застосовано ліміт: оброблятимемо {user_limit} з {original_count} доступних користувачів"
                 )
@@ -802,12 +852,18 @@ class SBCAttendeesScraper:
         print("📥 Завантажуємо існуючі чати...")
         self.messaging.load_chats_list(self.accounts)
 
-        success_count = 0
-        failed_count = 0
-        skipped_count = 0
-        excluded_count = 0
+        counts = Counter()
+
+        # Templates for the whole batch, drawn in one call
+        templates = self.messaging.pick_follow_up_formatters(len(user_data))
+
+        # The follow-up text is the same for every user in the batch
+        follow_up_line = (
+            f"   💬 + автоматичний follow-up: '{self.messaging.second_follow_up_message}'"
+        )
 
         for i, user_info in enumerate(user_data, 1):
+            started = time.monotonic()
             user_id = user_info["user_id"]
             first_name = user_info["first_name"]
             full_name = user_info["full_name"]
@@ -820,16 +876,13 @@ class SBCAttendeesScraper:
 
             try:
                 # Використовуємо звичайні повідомлення (з автоматичним follow-up)
-                message_template = random.choice(
-                    self.messaging.follow_up_messages
-                )
-                message = message_template.format(name=first_name)
+                message_template, format_message = templates[i - 1]
+                message = format_message(name=first_name)
 
+                # Both lines go out in one write
                 print(
-                    f"   💬 Відправляємо: '{message_template[:50]}...' з ім'ям '{first_name}'"
-                )
-                print(
-                    f"   💬 + автоматичний follow-up: '{self.messaging.second_follow_up_message}'"
+                    f"   💬 Відправляємо: '{message_template[:50]}...' з ім'ям '{first_name}'\n"
+                    + follow_up_line
                 )
 
                 # Відправляємо повідомлення (з автоматичним follow-up та перевіркою чату)
@@ -837,27 +890,30 @@ class SBCAttendeesScraper:
                     user_id, message, self.accounts, full_name, company_name
                 )
 
-                if success == "success":
-                    print(f"   ✅ Повідомлення відправлено")
-                    success_count += 1
-                elif success == "already_contacted":
-                    print(f"   ⏭️ Пропущено (чат вже має повідомлення)")
-                    skipped_count += 1
-                elif success == "excluded_company":
-                    print(f"   🚫 Пропущено (компанія виключена)")
-                    excluded_count += 1
-                else:
-                    print(f"   ❌ Помилка відправки")
-                    failed_count += 1
+                if success not in SEND_RESULT_MESSAGES:
+                    success = "failed"
+                print(f"   {SEND_RESULT_MESSAGES[success]}")
+                counts[success] += 1
 
-                # Затримка між повідомленнями
+                # Затримка між повідомленнями, відлічена від початку
+                # обробки, тож час відправки входить у неї
                 if i < len(user_data):
-                    print(f"   ⏱️ Чекаємо {delay_seconds} секунд...")
-                    time.sleep(delay_seconds)
+                    remaining = delay_seconds - (time.monotonic() - started)
+                    if remaining > 0:
+                        print(f"   ⏱️ Чекаємо {remaining:.1f} секунд...")
+                        time.sleep(remaining)
 
             except Exception as e:
                 print(f"   ❌ Помилка: {e}")
-                failed_count += 1
+                counts["failed"] += 1
+
+        success_count = counts["success"]
+        failed_count = counts["failed"]
+        skipped_count = counts["already_contacted"]
+        excluded_count = counts["excluded_company"]
+
+        # Write the CSV updates collected for this batch
+        self.data_processor.flush()
 
         print(f"\n📊 ПІДСУМОК для {account_name}:")
         print(f"   ✅ Успішно: {success_count}")
@@ -1041,9 +1097,7 @@ class SBCAttendeesScraper:
         print("• Відправляє conference followup тільки для позитивних розмов")
         print("=" * 60)
 
-        csv_file = os.path.join(
-            self.base_scraper.get_data_dir(), "SBC - Attendees.csv"
-        )
+        csv_file = self._default_csv
         if not os.path.exists(csv_file):
             print(f"❌ Main CSV file not found: {csv_file}")
             print(
@@ -1110,9 +1164,7 @@ class SBCAttendeesScraper:
         print("\n📬 CHECK FOR RESPONSES IN ALL CHATS (OPTIMIZED)")
         print("=" * 40)
 
-        csv_file = os.path.join(
-            self.base_scraper.get_data_dir(), "SBC - Attendees.csv"
-        )
+        csv_file = self._default_csv
         if not os.path.exists(csv_file):
             print(f"❌ Main CSV file not found: {csv_file}")
             print("   First run 'Scrape new contacts' to create the file")
@@ -1212,9 +1264,7 @@ class SBCAttendeesScraper:
         print("\n� UPDATE EXISTING CSV WITH CONTACTS")
         print("=" * 40)
 
-        csv_file = os.path.join(
-            self.base_scraper.get_data_dir(), "SBC - Attendees.csv"
-        )
+        csv_file = self._default_csv
         if not os.path.exists(csv_file):
             print(f"❌ Main CSV file not found: {csv_file}")
             print("   First run 'Scrape new contacts' to create the file")
@@ -1348,33 +1398,22 @@ class SBCAttendeesScraper:
         print("============================================================\n")
 
         print("📡 Етап 1: Завантаження даних з advanced search...")
-        all_results = []
-        batch_size = 2000
-        total_fetched = 0
-        for from_index in range(0, 20000, batch_size):
-            print(f"📥 Завантажуємо з індексу {from_index}...")
-            batch = self.base_scraper.advanced_search(
-                from_index=from_index, size=batch_size
-            )
-            if not batch:
-                print(f"   ❌ Не вдалося отримати дані з індексу {from_index}")
-                break
-            all_results.extend(batch)
-            total_fetched += len(batch)
-            print(
-                f"   ✅ Отримано {len(batch)} записів (всього: {total_fetched})"
-            )
-            if len(batch) < batch_size:
-                print(
-                    f"   📊 Досягнуто кінця (отримано {len(batch)} < {batch_size})"
-                )
-                break
+        all_results = self.base_scraper.get_all_advanced_search_results()
         print(f"✅ Всього знайдено: {len(all_results)} учасників\n")
 
+        # Overlapping pages can return the same attendee twice; keep the
+        # first copy so their details are fetched only once
+        unique_results = {}
+        for attendee in all_results:
+            attendee_id = attendee.get("id")
+            if attendee_id and attendee_id not in unique_results:
+                unique_results[attendee_id] = attendee
+        if len(unique_results) != len(all_results):
+            print(f"🔁 Унікальних учасників: {len(unique_results)}\n")
+        all_results = list(unique_results.values())
+
         print("📋 Етап 2: Порівняння з існуючою базою...")
-        csv_file = os.path.join(
-            self.base_scraper.get_data_dir(), "SBC - Attendees.csv"
-        )
+        csv_file = self._default_csv
         existing_keys = self.load_existing_attendees(csv_file)
         print(
             f"📋 Завантажено {len(existing_keys)} існуючих записів з {csv_file}"
@@ -1388,58 +1427,45 @@ class SBCAttendeesScraper:
             return
 
         print("🔍 Етап 3: Отримання детальних даних...")
-        detailed_attendees = self.process_new_attendees(new_attendees)
-
-        self.save_new_attendees(detailed_attendees, csv_file)
+        # Each attendee is written as soon as its details arrive
+        saved = self.save_new_attendees(
+            self.iter_new_attendee_details(new_attendees), csv_file
+        )
         print(
-            f"\n✅ Додавання нових учасників завершено. Всього додано: {len(detailed_attendees)}"
+            f"\n✅ Додавання нових учасників завершено. Всього додано: {saved}"
         )
 
     def load_existing_attendees(self, csv_file=None):
         """Loads existing attendees from CSV"""
         if not csv_file:
-            csv_file = os.path.join(
-                self.base_scraper.get_data_dir(), "SBC - Attendees.csv"
-            )
+            csv_file = self._default_csv
 
         existing_keys = set()
 
         if os.path.exists(csv_file):
             try:
-                # Check if pandas is available by attempting import
-                try:
-                    import pandas as pd
-
-                    pandas_available = True
-                except ImportError:
-                    pandas_available = False
-
-                if pandas_available:
-                    df = pd.read_csv(csv_file)
-                    for _, row in df.iterrows():
-                        source_url = row.get("source_url", "")
-                        if source_url:
-                            user_id = (
-                                self.data_processor.extract_user_id_from_url(
-                                    source_url
-                                )
-                            )
-                            if user_id:
-                                existing_keys.add(user_id)
-                else:
-                    # Fallback to basic CSV processing
-                    import csv
-
-                    with open(csv_file, "r", encoding="utf-8") as f:
-                        reader = csv.DictReader(f)
+                # Pending updates must be on disk before the file is read
+                self.data_processor.flush(csv_file)
+
+                # Streamed row by row: only source_url is needed, so no
+                # DataFrame is built
+                search_id = ATTENDEE_RE.search
+                with open(
+                    csv_file,
+                    "r",
+                    encoding="utf-8-sig",
+                    newline="",
+                    buffering=CSV_BUFFER_SIZE,
+                ) as f:
+                    reader = csv.reader(f)
+                    header = next(reader, [])
+                    if "source_url" in header:
+                        url_i = header.index("source_url")
                         for row in reader:
-                            source_url = row.get("source_url", "")
-                            if source_url:
-                                user_id = self.data_processor.extract_user_id_from_url(
-                                    source_url
-                                )
-                                if user_id:
-                                    existing_keys.add(user_id)
+                            if url_i < len(row):
+                                match = search_id(row[url_i])
+                                if match:
+                                    existing_keys.add(match.group(1))
 
                 print(f"📋 Loaded {len(existing_keys)} existing attendees")
             except Exception as e:
@@ -1449,35 +1475,66 @@ class SBCAttendeesScraper:
 
     def find_new_attendees(self, search_results, existing_keys):
         """Finds new attendees not in existing database"""
-        new_attendees = []
-
-        for attendee in search_results:
-            attendee_id = attendee.get("id")
-            if attendee_id and attendee_id not in existing_keys:
-                new_attendees.append(attendee)
-
-        return new_attendees
+        return [
+            attendee
+            for attendee in search_results
+            if (attendee_id := attendee.get("id"))
+            and attendee_id not in existing_keys
+        ]
 
     def process_new_attendees(self, new_attendees):
         """Processes new attendees to get detailed information"""
-        detailed_attendees = []
-
-        for i, attendee in enumerate(new_attendees, 1):
+        return list(self.iter_new_attendee_details(new_attendees))
+
+    def iter_new_attendee_details(self, new_attendees):
+        """Yields formatted details of new attendees as they are fetched
+
+        With a thread-safe transport, up to USER_DETAILS_WORKERS requests
+        are in flight at once. Request starts stay USER_DETAILS_INTERVAL
+        apart either way, so the API sees the same pace as before. Results
+        come in new_attendees order.
+        """
+        lock = threading.Lock()
+        next_start = time.monotonic()
+
+        def fetch(item):
+            nonlocal next_start
+            i, attendee = item
             attendee_id = attendee.get("id")
+
+            # Small delay to avoid overwhelming the API
+            with lock:
+                now = time.monotonic()
+                start = max(now, next_start)
+                next_start = start + USER_DETAILS_INTERVAL
+            time.sleep(start - now)
+
             print(f"📊 [{i}/{len(new_attendees)}] Processing {attendee_id}...")
 
             # Get detailed user information
-            user_details = self.base_scraper.get_user_details(attendee_id)
+            return self.base_scraper.get_user_details(attendee_id)
 
-            if user_details:
-                formatted_attendee = self.format_attendee_for_csv(user_details)
-                if formatted_attendee:
-                    detailed_attendees.append(formatted_attendee)
-
-            # Small delay to avoid overwhelming the API
-            time.sleep(0.5)
+        def formatted(results):
+            for user_details in results:
+                if user_details:
+                    formatted_attendee = self.format_attendee_for_csv(
+                        user_details
+                    )
+                    if formatted_attendee:
+                        yield formatted_attendee
 
-        return detailed_attendees
+        items = enumerate(new_attendees, 1)
+        if self.base_scraper._can_prefetch():
+            executor = ThreadPoolExecutor(max_workers=USER_DETAILS_WORKERS)
+            try:
+                # map() keeps the results in new_attendees order
+                yield from formatted(executor.map(fetch, items))
+            finally:
+                # An early stop drops the queued fetches instead of waiting
+                # out their paced sleeps
+                executor.shutdown(cancel_futures=True)
+        else:
+            yield from formatted(map(fetch, items))
 
     def format_attendee_for_csv(self, attendee_details):
         """Formats attendee details for CSV output"""
@@ -1499,19 +1556,14 @@ class SBCAttendeesScraper:
             email = attendee_details.get("email", "")
             phone = attendee_details.get("phone", "")
 
-            # Extract gaming vertical and organization type
-            gaming_vertical = ""
-            organization_type = ""
-
-            if "gamingVerticals" in attendee_details:
-                gaming_verticals = attendee_details["gamingVerticals"]
-                if gaming_verticals:
-                    gaming_vertical = ", ".join(gaming_verticals)
-
-            if "organizationTypes" in attendee_details:
-                org_types = attendee_details["organizationTypes"]
-                if org_types:
-                    organization_type = ", ".join(org_types)
+            # Extract gaming vertical and organization type; a missing key,
+            # None and an empty list all give ""
+            gaming_vertical = ", ".join(
+                attendee_details.get("gamingVerticals") or ()
+            )
+            organization_type = ", ".join(
+                attendee_details.get("organizationTypes") or ()
+            )
 
             return {
                 "source_url": source_url,
@@ -1536,41 +1588,67 @@ class SBCAttendeesScraper:
             return None
 
     def save_new_attendees(self, new_attendees_data, csv_file=None):
-        """Saves new attendees to CSV file"""
+        """Saves new attendees to CSV file, returns the number saved
+
+        Takes any iterable, so rows can be written while later attendees
+        are still being fetched. The file is flushed every
+        ATTENDEE_FLUSH_ROWS rows; an interrupted run keeps what it saved.
+        """
         if not csv_file:
-            csv_file = os.path.join(
-                self.base_scraper.get_data_dir(), "SBC - Attendees.csv"
-            )
+            csv_file = self._default_csv
 
-        if not new_attendees_data:
+        rows = iter(new_attendees_data)
+        first = next(rows, None)
+        if first is None:
             print("No new attendees to save")
-            return
+            return 0
 
+        saved = 0
         try:
-            # Check if file exists to determine if we need headers
-            file_exists = os.path.exists(csv_file)
-
-            import csv
+            # Pending in-memory updates must not overwrite the appended rows
+            self.data_processor.flush(csv_file)
 
-            with open(csv_file, "a", newline="", encoding="utf-8") as f:
-                if new_attendees_data:
-                    fieldnames = new_attendees_data[0].keys()
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-                    # Write header only if file is new
-                    if not file_exists:
-                        writer.writeheader()
+            # Check if file exists to determine if we need headers
+            file_exists = (
+                os.path.exists(csv_file) and os.path.getsize(csv_file) > 0
+            )
+            # Rows follow the existing header, so appended cells line up
+            # with their columns even if the file was reordered
+            fieldnames = (
+                self.data_processor._csv_headers(csv_file)
+                if file_exists
+                else ATTENDEE_CSV_FIELDS
+            )
 
-                    # Write data
-                    writer.writerows(new_attendees_data)
+            with open(
+                csv_file,
+                "a",
+                newline="",
+                encoding="utf-8",
+                buffering=CSV_BUFFER_SIZE,
+            ) as f:
+                writer = csv.writer(f)
+
+                # Write header only if file is new
+                if not file_exists:
+                    writer.writerow(fieldnames)
+
+                # Write data
+                for attendee in itertools.chain((first,), rows):
+                    writer.writerow(
+                        [attendee.get(field, "") for field in fieldnames]
+                    )
+                    saved += 1
+                    if saved % ATTENDEE_FLUSH_ROWS == 0:
+                        f.flush()
 
-            print(
-                f"✅ Saved {len(new_attendees_data)} new attendees to {csv_file}"
-            )
+            print(f"✅ Saved {saved} new attendees to {csv_file}")
 
         except Exception as e:
             print(f"❌ Error saving attendees: {e}")
 
+        return saved
+
     def process_followup_campaigns_optimized(
         self, csv_file: str, followup_type: str
     ) -> Dict[str, int]:
@@ -1598,6 +1676,8 @@ class SBCAttendeesScraper:
 
         accounts_to_use = account_mapping.get(followup_type, ["messenger1"])
         original_account = self.base_scraper.current_account
+        # chat_id -> followup_type, written to the CSV in one pass at the end
+        sent_followups = {}
 
         try:
             # Get candidates from CSV
@@ -1608,6 +1688,11 @@ class SBCAttendeesScraper:
 
             print(f"🎯 Знайдено кандидатів: {len(candidates)}")
 
+            # CSV follow-up statuses, read once instead of per candidate
+            csv_sent_chats = self.messaging.load_followup_sent_chats(
+                csv_file, followup_type
+            )
+
             for account_key in accounts_to_use:
                 if account_key not in self.accounts:
                     continue
@@ -1626,6 +1711,11 @@ class SBCAttendeesScraper:
                 for candidate in candidates:
                     chat_id = candidate["chat_id"]
 
+                    # Already sent from another account during this run
+                    if chat_id in sent_followups:
+                        stats["already_sent"] += 1
+                        continue
+
                     try:
                         # Check if chat exists and is accessible
                         chat_details = self.messaging.load_chat_details(
@@ -1643,6 +1733,7 @@ class SBCAttendeesScraper:
                                 followup_type,
                                 chat_details,
                                 self.accounts,
+                                csv_sent_chats=csv_sent_chats,
                             )
                         )
 
@@ -1656,19 +1747,17 @@ class SBCAttendeesScraper:
                             participant_name
                         )
 
+                        # Spacing per account; the lookups above ran
+                        # inside it
+                        self.messaging.wait_for_followup_slot()
                         success = self.messaging.send_followup_message(
                             chat_id, followup_type, participant_name, language
                         )
 
                         if success:
                             stats["messages_sent"] += 1
-                            # Update CSV
-                            self.data_processor.update_csv_followup_status(
-                                csv_file, chat_id, followup_type
-                            )
-
-                            # Small delay between messages
-                            time.sleep(2)
+                            # Update CSV (in bulk, after the campaign)
+                            sent_followups[chat_id] = followup_type
                         else:
                             stats["errors"] += 1
 
@@ -1681,6 +1770,12 @@ class SBCAttendeesScraper:
             stats["errors"] += 1
 
         finally:
+            # Write the CSV updates collected during the campaign
+            self.data_processor.update_csv_followup_status_bulk(
+                csv_file, sent_followups
+            )
+            self.data_processor.flush()
+
             # Restore original account
             if (
                 original_account
@@ -1718,75 +1813,50 @@ class SBCAttendeesScraper:
             "already_sent": 0,
             "errors": 0,
         }
+        # chat_id -> followup_type, written to the CSV in one pass at the end
+        sent_followups = {}
 
         try:
-            with open(csv_file, "r", encoding="utf-8", newline="") as file:
-                reader = csv.DictReader(file)
-
-                for row in reader:
-                    stats["total_checked"] += 1
-
-                    # Check if this row matches the author
-                    row_author = row.get("Author", "").strip()
-                    if row_author != author_name:
-                        continue
-
-                    stats["matching_author"] += 1
-                    chat_id = row.get("Chat ID", "").strip()
-
-                    if not chat_id:
-                        continue
+            # Rows are filtered by author and sent status while reading;
+            # only the sends below run per row
+            rows = self.data_processor.iter_author_followup_rows(
+                csv_file, author_name, stats
+            )
+            for row in rows:
+                chat_id = row["chat_id"]
+                participant_name = row["participant_name"]
 
-                    # Determine followup type based on message status and timing
-                    sent_status = row.get("Sent", "").strip().lower()
-                    if sent_status not in ["true", "yes", "1", "sent"]:
-                        continue
+                followup_type = NEXT_AUTHOR_FOLLOWUP[
+                    row["weekly_sent"], row["monthly_sent"]
+                ]
+                if followup_type is None:
+                    stats["already_sent"] += 1
+                    continue
 
-                    # Check what followups haven't been sent yet
-                    weekly_sent = (
-                        row.get("Weekly Follow-up", "").strip().lower()
-                    )
-                    monthly_sent = (
-                        row.get("Monthly Follow-up", "").strip().lower()
+                try:
+                    self.messaging.wait_for_followup_slot()
+                    success = self.messaging.send_followup_message(
+                        chat_id, followup_type, participant_name, "en"
                     )
+                    if success:
+                        stats[f"{followup_type}_sent"] += 1
+                        sent_followups[chat_id] = followup_type
 
-                    participant_name = f"{row.get('First Name', '')} {row.get('Last Name', '')}".strip()
-
-                    try:
-                        # Try weekly followup first
-                        if weekly_sent not in ["true", "yes", "1", "sent"]:
-                            success = self.messaging.send_followup_message(
-                                chat_id, "weekly", participant_name, "en"
-                            )
-                            if success:
-                                stats["weekly_sent"] += 1
-                                self.data_processor.update_csv_followup_status(
-                                    csv_file, chat_id, "weekly"
-                                )
-                                time.sleep(2)
-
-                        # Then try monthly followup
-                        elif monthly_sent not in ["true", "yes", "1", "sent"]:
-                            success = self.messaging.send_followup_message(
-                                chat_id, "monthly", participant_name, "en"
-                            )
-                            if success:
-                                stats["monthly_sent"] += 1
-                                self.data_processor.update_csv_followup_status(
-                                    csv_file, chat_id, "monthly"
-                                )
-                                time.sleep(2)
-                        else:
-                            stats["already_sent"] += 1
-
-                    except Exception as e:
-                        print(f"⚠️ Помилка відправки для {chat_id}: {e}")
-                        stats["errors"] += 1
+                except Exception as e:
+                    print(f"⚠️ Помилка відправки для {chat_id}: {e}")
+                    stats["errors"] += 1
 
         except Exception as e:
             print(f"❌ Помилка обробки файлу: {e}")
             stats["errors"] += 1
 
+        finally:
+            # Write the CSV updates collected during the campaign
+            self.data_processor.update_csv_followup_status_bulk(
+                csv_file, sent_followups
+            )
+            self.data_processor.flush()
+
         # Print summary
         print(f"\n📊 ПІДСУМКИ КАМПАНІЇ ЗА АВТОРОМ '{author_name}':")
         print(f"   📋 Рядків перевірено: {stats['total_checked']}")
@@ -1803,9 +1873,7 @@ class SBCAttendeesScraper:
     ) -> Dict[str, int]:
         """Показує статистику CSV файлу для перевірки відповідей"""
         if not csv_file:
-            csv_file = os.path.join(
-                self.base_scraper.get_data_dir(), "SBC - Attendees.csv"
-            )
+            csv_file = self._default_csv
 
         if not PANDAS_AVAILABLE:
             print("❌ pandas не встановлено")
@@ -1899,9 +1967,7 @@ class SBCAttendeesScraper:
     def update_existing_csv_with_contacts(self, csv_file=None):
         """Updates existing CSV file to extract contacts for profiles that don't have them yet"""
         if csv_file is None:
-            csv_file = os.path.join(
-                self.base_scraper.get_data_dir(), "SBC - Attendees.csv"
-            )
+            csv_file = self._default_csv
 
         print(f"\n📞 ОНОВЛЕННЯ ІСНУЮЧОГО CSV З КОНТАКТАМИ")
         print("=" * 50)
@@ -1912,7 +1978,8 @@ class SBCAttendeesScraper:
 
         try:
             if PANDAS_AVAILABLE:
-                # Read CSV with pandas
+                # Read CSV with pandas (after pending updates are written)
+                self.data_processor.flush(csv_file)
                 df = pd.read_csv(csv_file)
 
                 # Check if other_contacts column exists, if not add it
@@ -1962,8 +2029,8 @@ class SBCAttendeesScraper:
                         if (idx + 1) % 50 == 0:
                             print(f"   📊 Оброблено {idx + 1} записів...")
 
-                # Save updated CSV
-                df.to_csv(csv_file, index=False)
+                # Save updated CSV (swapped in atomically)
+                self.data_processor.write_csv_atomic(df, csv_file)
                 print(
                     f"\n✅ Оновлено {contacts_extracted} профілів з контактами"
                 )
@@ -1979,4 +2046,6 @@ class SBCAttendeesScraper:
 
     def close(self):
         """Closes browser and cleans up resources"""
+        # Don't lose CSV updates that were not flushed yet
+        self.data_processor.flush()
         self.base_scraper.close()
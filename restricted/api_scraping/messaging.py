@@ -5,12 +5,250 @@ Messaging functionality for chat management, message sending, and follow-up camp
 import uuid
 import time
 import json
+import functools
+import random
 import re
+from collections import deque
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from typing import Dict, List, Optional, Any
 import os
 
+try:
+    import pandas as pd
+
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+KYIV_TZ = ZoneInfo("Europe/Kiev")
+
+# Lowercased follow-up status cells that mean the follow-up went out
+FOLLOWUP_SENT_STATUSES = frozenset(("sent", "true", "1"))
+
+# Follow-up sends allowed per account within each window of seconds
+FOLLOWUP_SENDS_PER_WINDOW = 1
+FOLLOWUP_SEND_WINDOW = 2
+
+
+# Keywords counted by detect_language; repeated words count twice, as they
+# always have
+ENGLISH_INDICATORS = (
+    "the",
+    "and",
+    "you",
+    "that",
+    "will",
+    "with",
+    "have",
+    "this",
+    "for",
+    "not",
+    "are",
+    "but",
+    "what",
+    "all",
+    "were",
+    "they",
+    "been",
+    "said",
+    "each",
+    "which",
+    "their",
+    "time",
+    "would",
+    "about",
+    "if",
+    "up",
+    "out",
+    "many",
+    "then",
+    "them",
+    "these",
+    "so",
+    "some",
+    "her",
+    "would",
+    "make",
+    "like",
+    "into",
+    "him",
+    "has",
+    "two",
+    "more",
+    "very",
+    "after",
+    "words",
+    "long",
+    "than",
+    "first",
+    "water",
+    "been",
+    "call",
+    "who",
+    "its",
+    "now",
+    "find",
+    "long",
+    "down",
+    "day",
+    "did",
+    "get",
+    "come",
+    "made",
+    "may",
+    "part",
+)
+UKRAINIAN_INDICATORS = (
+    "та",
+    "що",
+    "не",
+    "на",
+    "в",
+    "я",
+    "з",
+    "до",
+    "від",
+    "за",
+    "про",
+    "під",
+    "над",
+    "при",
+    "або",
+    "але",
+    "це",
+    "як",
+    "так",
+    "уже",
+    "тут",
+    "там",
+    "коли",
+    "де",
+    "чому",
+    "хто",
+    "який",
+    "яка",
+    "які",
+    "для",
+    "без",
+    "через",
+    "після",
+    "перед",
+    "між",
+    "серед",
+    "поза",
+    "крім",
+    "окрім",
+    "разом",
+    "українською",
+    "україна",
+    "київ",
+    "львів",
+    "одеса",
+    "харків",
+    "дніпро",
+)
+RUSSIAN_INDICATORS = (
+    "и",
+    "не",
+    "на",
+    "в",
+    "я",
+    "с",
+    "до",
+    "от",
+    "за",
+    "про",
+    "под",
+    "над",
+    "при",
+    "или",
+    "но",
+    "это",
+    "как",
+    "так",
+    "уже",
+    "тут",
+    "там",
+    "когда",
+    "где",
+    "почему",
+    "кто",
+    "какой",
+    "какая",
+    "какие",
+    "для",
+    "без",
+    "русским",
+    "россия",
+    "москва",
+    "санкт-петербург",
+    "новосибирск",
+)
+UKRAINIAN_CHARS_RE = re.compile(r"[іїєґ]")
+CYRILLIC_RE = re.compile(r"[а-яё]")
+
+
+@functools.lru_cache(maxsize=8192)
+def _detect_language(text: str) -> str:
+    """Detects the language of a message using simple keyword matching
+
+    Pure function of its input, so results are memoized across calls.
+    """
+    if not text:
+        return "unknown"
+
+    text_lower = text.lower()
+
+    # Count matches
+    english_score = sum(1 for word in ENGLISH_INDICATORS if word in text_lower)
+    ukrainian_score = sum(
+        1 for word in UKRAINIAN_INDICATORS if word in text_lower
+    )
+    russian_score = sum(1 for word in RUSSIAN_INDICATORS if word in text_lower)
+
+    # Check for specific Ukrainian characters
+    has_ukrainian_chars = bool(UKRAINIAN_CHARS_RE.search(text_lower))
+
+    # Check for Cyrillic characters
+    has_cyrillic = bool(CYRILLIC_RE.search(text_lower))
+
+    # Determine language
+    if has_ukrainian_chars or ukrainian_score > max(
+        russian_score, english_score
+    ):
+        return "ua"
+    elif has_cyrillic or russian_score > max(ukrainian_score, english_score):
+        return "ru"
+    elif english_score > 0:
+        return "en"
+    else:
+        # Default to English if unclear
+        return "en"
+
+
+class RateLimiter:
+    """Sliding-window limiter: at most max_requests starts per window"""
+
+    def __init__(self, max_requests: int, window_seconds: float):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._requests = deque()
+
+    def acquire(self):
+        """Blocks until another request may start, then records it"""
+        now = time.monotonic()
+        # Starts older than the window no longer count
+        cutoff = now - self.window_seconds
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+
+        if len(self._requests) >= self.max_requests:
+            time.sleep(self.window_seconds - (now - self._requests.popleft()))
+            now = time.monotonic()
+
+        self._requests.append(now)
+
 
 class MessagingHandler:
     """Handles all messaging functionality including chats, messages, and follow-up campaigns"""
@@ -20,6 +258,8 @@ class MessagingHandler:
         self.company_filter = company_filter
         self.data_processor = data_processor
         self.existing_chats = {}  # Cache of existing chats {user_id: chat_id}
+        # account_key -> RateLimiter for follow-up sends
+        self._followup_limiters = {}
 
         # Follow-up message templates
         self.follow_up_messages = [
@@ -29,6 +269,12 @@ class MessagingHandler:
             "Hi {name}, looks like we'll both be at SBC Lisbon today!\nAlways great to meet fellow iGaming pros before the chaos begins.\nI'm with Flexify Finance, a payments provider for high-risk verticals - you'll find us at Stand E613.\nOut of curiosity, what's your main focus at the expo this year ?",
         ]
 
+        # (template, bound format) pairs picked by the bulk send loops
+        self._follow_up_formatters = tuple(
+            (template, template.format)
+            for template in self.follow_up_messages
+        )
+
         # Second follow-up message that always gets sent after the first one
         self.second_follow_up_message = (
             "Is payments something on your radar to explore ?"
@@ -47,8 +293,11 @@ class MessagingHandler:
         }
 
         # SBC Summit start date (September 16, 2025) in Kyiv timezone
-        kyiv_tz = ZoneInfo("Europe/Kiev")
-        self.sbc_start_date = datetime(2025, 9, 16, tzinfo=kyiv_tz)
+        self.sbc_start_date = datetime(2025, 9, 16, tzinfo=KYIV_TZ)
+
+    def pick_follow_up_formatters(self, k):
+        """Draws k random (template, bound format) pairs for a send batch"""
+        return random.choices(self._follow_up_formatters, k=k)
 
     def load_chats_list(self, accounts):
         """Loads the list of existing chats"""
@@ -366,8 +615,6 @@ class MessagingHandler:
         result["first_message_date"] = first_message_timestamp
 
         # Calculate days since first message
-        kyiv_tz = ZoneInfo("Europe/Kiev")
-
         # Convert to Kyiv time for consistency
         if first_message_timestamp.tzinfo is None:
             # If no timezone info, assume UTC
@@ -375,8 +622,8 @@ class MessagingHandler:
                 tzinfo=ZoneInfo("UTC")
             )
 
-        current_time = datetime.now(kyiv_tz)
-        first_message_kyiv = first_message_timestamp.astimezone(kyiv_tz)
+        current_time = datetime.now(KYIV_TZ)
+        first_message_kyiv = first_message_timestamp.astimezone(KYIV_TZ)
 
         days_diff = (current_time.date() - first_message_kyiv.date()).days
         result["days_since_first"] = days_diff
@@ -401,7 +648,7 @@ class MessagingHandler:
         # If no response, determine follow-up type
         if not result["has_response"]:
             # Check current time vs conference date
-            current_time_kyiv = datetime.now(kyiv_tz)
+            current_time_kyiv = datetime.now(KYIV_TZ)
             if current_time_kyiv.date() >= self.sbc_start_date.date():
                 result["followup_type"] = "conference_active"
                 result["needs_followup"] = True
@@ -417,6 +664,20 @@ class MessagingHandler:
 
         return result
 
+    def wait_for_followup_slot(self):
+        """Waits until the current account may send another follow-up
+
+        Time spent since the account's previous send counts toward the
+        spacing, so only the remainder is slept.
+        """
+        account_key = self.base_scraper.current_account
+        limiter = self._followup_limiters.get(account_key)
+        if limiter is None:
+            limiter = self._followup_limiters[account_key] = RateLimiter(
+                FOLLOWUP_SENDS_PER_WINDOW, FOLLOWUP_SEND_WINDOW
+            )
+        limiter.acquire()
+
     def send_followup_message(
         self,
         chat_id: str,
@@ -430,11 +691,7 @@ class MessagingHandler:
             return False
 
         # Get first name
-        first_name = (
-            participant_name.split()[0]
-            if participant_name.split()
-            else "there"
-        )
+        first_name = (participant_name.split(None, 1) or ["there"])[0]
 
         # Format message
         template = self.follow_up_templates[followup_type]
@@ -462,200 +719,7 @@ class MessagingHandler:
 
     def detect_language(self, text: str) -> str:
         """Detects the language of a message using simple keyword matching"""
-        if not text:
-            return "unknown"
-
-        text_lower = text.lower()
-
-        # English keywords and patterns
-        english_indicators = [
-            "the",
-            "and",
-            "you",
-            "that",
-            "will",
-            "with",
-            "have",
-            "this",
-            "for",
-            "not",
-            "are",
-            "but",
-            "what",
-            "all",
-            "were",
-            "they",
-            "been",
-            "said",
-            "each",
-            "which",
-            "their",
-            "time",
-            "would",
-            "about",
-            "if",
-            "up",
-            "out",
-            "many",
-            "then",
-            "them",
-            "these",
-            "so",
-            "some",
-            "her",
-            "would",
-            "make",
-            "like",
-            "into",
-            "him",
-            "has",
-            "two",
-            "more",
-            "very",
-            "after",
-            "words",
-            "long",
-            "than",
-            "first",
-            "water",
-            "been",
-            "call",
-            "who",
-            "its",
-            "now",
-            "find",
-            "long",
-            "down",
-            "day",
-            "did",
-            "get",
-            "come",
-            "made",
-            "may",
-            "part",
-        ]
-
-        # Ukrainian specific keywords
-        ukrainian_indicators = [
-            "та",
-            "що",
-            "не",
-            "на",
-            "в",
-            "я",
-            "з",
-            "до",
-            "від",
-            "за",
-            "про",
-            "під",
-            "над",
-            "при",
-            "або",
-            "але",
-            "це",
-            "як",
-            "так",
-            "уже",
-            "тут",
-            "там",
-            "коли",
-            "де",
-            "чому",
-            "хто",
-            "який",
-            "яка",
-            "які",
-            "для",
-            "без",
-            "через",
-            "після",
-            "перед",
-            "між",
-            "серед",
-            "поза",
-            "крім",
-            "окрім",
-            "разом",
-            "українською",
-            "україна",
-            "київ",
-            "львів",
-            "одеса",
-            "харків",
-            "дніпро",
-        ]
-
-        # Russian specific keywords
-        russian_indicators = [
-            "и",
-            "не",
-            "на",
-            "в",
-            "я",
-            "с",
-            "до",
-            "от",
-            "за",
-            "про",
-            "под",
-            "над",
-            "при",
-            "или",
-            "но",
-            "это",
-            "как",
-            "так",
-            "уже",
-            "тут",
-            "там",
-            "когда",
-            "где",
-            "почему",
-            "кто",
-            "какой",
-            "какая",
-            "какие",
-            "для",
-            "без",
-            "русским",
-            "россия",
-            "москва",
-            "санкт-петербург",
-            "новосибирск",
-        ]
-
-        # Count matches
-        english_score = sum(
-            1 for word in english_indicators if word in text_lower
-        )
-        ukrainian_score = sum(
-            1 for word in ukrainian_indicators if word in text_lower
-        )
-        russian_score = sum(
-            1 for word in russian_indicators if word in text_lower
-        )
-
-        # Check for specific Ukrainian characters
-        has_ukrainian_chars = bool(re.search(r"[іїєґ]", text_lower))
-
-        # Check for Cyrillic characters
-        has_cyrillic = bool(re.search(r"[а-яё]", text_lower))
-
-        # Determine language
-        if has_ukrainian_chars or ukrainian_score > max(
-            russian_score, english_score
-        ):
-            return "ua"
-        elif has_cyrillic or russian_score > max(
-            ukrainian_score, english_score
-        ):
-            return "ru"
-        elif english_score > 0:
-            return "en"
-        else:
-            # Default to English if unclear
-            return "en"
+        return _detect_language(text)
 
     def detect_positive_sentiment(
         self, text: str, language: str = "en"
@@ -923,6 +987,89 @@ class MessagingHandler:
 
         return False
 
+    def load_followup_sent_chats(
+        self, csv_file: str, followup_type: str
+    ) -> Optional[set]:
+        """Reads the CSV once and returns the chat ids it marks as sent
+
+        Gives the same answer as the CSV tier of check_followup_already_sent
+        for every chat, so a campaign can check each candidate with a set
+        lookup. Returns None when the CSV cannot be read this way; the
+        checks then read it themselves.
+        """
+        if not PANDAS_AVAILABLE:
+            return None
+
+        try:
+            self.data_processor.flush(csv_file)
+            df = pd.read_csv(csv_file)
+            # Only the first row of a chat is looked at
+            df = df.drop_duplicates("chat_id")
+
+            sent = pd.Series(False, index=df.index)
+            if followup_type == "conference_active":
+                column_name = "Conference Active Status"
+            else:
+                column_name = f"Follow_up_{followup_type}_status"
+                if column_name not in df.columns:
+                    # Legacy "Follow-up type" column
+                    legacy = df["Follow-up type"]
+                    sent = legacy.notna() & legacy.astype(str).str.contains(
+                        followup_type, regex=False
+                    )
+
+            if column_name in df.columns:
+                status = df[column_name]
+                sent |= status.notna() & status.astype(str).str.lower().isin(
+                    FOLLOWUP_SENT_STATUSES
+                )
+
+            return set(df.loc[sent, "chat_id"])
+
+        except Exception as e:
+            print(f"       ⚠️ Помилка читання статусів follow-up: {e}")
+            return None
+
+    def _csv_followup_sent(
+        self, csv_file: str, chat_id: str, followup_type: str
+    ) -> bool:
+        """Reads the CSV and checks whether it marks this follow-up as sent"""
+        if not PANDAS_AVAILABLE:
+            raise ImportError("pandas not available")
+
+        # Pending in-memory updates must be on disk before reading
+        self.data_processor.flush(csv_file)
+        df = pd.read_csv(csv_file)
+
+        # Знаходимо рядок з цим chat_id
+        chat_row = df[df["chat_id"] == chat_id]
+
+        csv_says_sent = False
+        if not chat_row.empty:
+            # Перевіряємо статус цього followup_type
+            if followup_type == "conference_active":
+                column_name = "Conference Active Status"
+            else:
+                # Check both new column format and legacy format
+                column_name = f"Follow_up_{followup_type}_status"
+                if column_name not in df.columns:
+                    # Fallback to legacy "Follow-up type" column
+                    followup_type_col = chat_row["Follow-up type"].iloc[0]
+                    if pd.notna(
+                        followup_type_col
+                    ) and followup_type in str(followup_type_col):
+                        csv_says_sent = True
+
+            if column_name in df.columns and not csv_says_sent:
+                status = chat_row[column_name].iloc[0]
+                if (
+                    pd.notna(status)
+                    and str(status).lower() in FOLLOWUP_SENT_STATUSES
+                ):
+                    csv_says_sent = True
+
+        return csv_says_sent
+
     def check_followup_already_sent(
         self,
         csv_file: str,
@@ -930,41 +1077,21 @@ class MessagingHandler:
         followup_type: str,
         chat_data: dict = None,
         accounts: dict = None,
+        csv_sent_chats: set = None,
     ) -> bool:
-        """Перевіряє чи вже був відправлений follow-up цього типу з покращеною двохрівневою логікою"""
-        try:
-            import pandas as pd
+        """Перевіряє чи вже був відправлений follow-up цього типу з покращеною двохрівневою логікою
 
+        csv_sent_chats, from load_followup_sent_chats, answers the CSV check
+        without reading the file again.
+        """
+        try:
             # TIER 1: Швидка перевірка CSV (primary defense)
-            df = pd.read_csv(csv_file)
-
-            # Знаходимо рядок з цим chat_id
-            chat_row = df[df["chat_id"] == chat_id]
-
-            csv_says_sent = False
-            if not chat_row.empty:
-                # Перевіряємо статус цього followup_type
-                if followup_type == "conference_active":
-                    column_name = "Conference Active Status"
-                else:
-                    # Check both new column format and legacy format
-                    column_name = f"Follow_up_{followup_type}_status"
-                    if column_name not in df.columns:
-                        # Fallback to legacy "Follow-up type" column
-                        followup_type_col = chat_row["Follow-up type"].iloc[0]
-                        if pd.notna(
-                            followup_type_col
-                        ) and followup_type in str(followup_type_col):
-                            csv_says_sent = True
-
-                if column_name in df.columns and not csv_says_sent:
-                    status = chat_row[column_name].iloc[0]
-                    if pd.notna(status) and str(status).lower() in [
-                        "sent",
-                        "true",
-                        "1",
-                    ]:
-                        csv_says_sent = True
+            if csv_sent_chats is not None:
+                csv_says_sent = chat_id in csv_sent_chats
+            else:
+                csv_says_sent = self._csv_followup_sent(
+                    csv_file, chat_id, followup_type
+                )
 
             # Якщо CSV каже, що відправлено - довіряємо йому (оптимізація)
             if csv_says_sent:
@@ -987,6 +1114,8 @@ class MessagingHandler:
                     self.data_processor.update_csv_followup_status(
                         csv_file, chat_id, followup_type, chat_data
                     )
+                    if csv_sent_chats is not None:
+                        csv_sent_chats.add(chat_id)
 
                 return message_says_sent
 
@@ -1091,6 +1220,11 @@ class MessagingHandler:
         original_account = self.base_scraper.current_account
 
         try:
+            # CSV follow-up statuses, read once for the whole campaign
+            csv_sent_chats = self.load_followup_sent_chats(
+                csv_file, "conference_active"
+            )
+
             for account_key in messenger_accounts:
                 if account_key not in accounts:
                     continue
@@ -1169,6 +1303,7 @@ class MessagingHandler:
                                 chat_id,
                                 "conference_active",
                                 chat_details,
+                                csv_sent_chats=csv_sent_chats,
                             )
 
                             if already_sent:
@@ -1195,6 +1330,8 @@ class MessagingHandler:
                                     self.data_processor.update_csv_followup_status(
                                         csv_file, chat_id, "conference_active"
                                     )
+                                    if csv_sent_chats is not None:
+                                        csv_sent_chats.add(chat_id)
                                 else:
                                     stats["errors"] += 1
 
@@ -1203,6 +1340,9 @@ class MessagingHandler:
             stats["errors"] += 1
 
         finally:
+            # Write the CSV updates collected during the campaign
+            self.data_processor.flush()
+
             # Restore original account
             if (
                 original_account
@@ -1341,6 +1481,9 @@ class MessagingHandler:
         except Exception as e:
             print(f"❌ Критична помилка: {e}")
             stats["errors"] += 1
+        finally:
+            # Write the response statuses collected in memory
+            self.data_processor.flush(csv_file)
 
         # Print summary
         print(f"\n📊 ПІДСУМКИ ОПТИМІЗОВАНОЇ ПЕРЕВІРКИ ВІДПОВІДЕЙ:")
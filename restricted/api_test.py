@@ -11,6 +11,7 @@ import shutil
 import traceback
 from zoneinfo import ZoneInfo
 from typing import List, Dict, Set, Tuple, Optional
+from collections import Counter
 from config import settings
 
 try:
@@ -26,6 +27,15 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from extract_contacts import ContactExtractor
 
+# Console line and counter key for each send_message_to_user result;
+# anything else counts as a failed send
+SEND_RESULT_MESSAGES = {
+    "success": "✅ Повідомлення відправлено",
+    "already_contacted": "⏭️ Пропущено (чат вже має повідомлення)",
+    "excluded_company": "🚫 Пропущено (компанія виключена)",
+    "failed": "❌ Помилка відправки",
+}
+
 
 class SBCAttendeesScraper:
     def __init__(self, headless=True, proxy_config: Dict[str, str] = None):
@@ -89,6 +99,12 @@ class SBCAttendeesScraper:
             "Hi {name}, looks like we'll both be at SBC Lisbon!\nAlways great to meet fellow iGaming pros before the chaos begins.\nI'm with Flexify Finance, a payments provider for high-risk verticals - you'll find us at Stand E613.\nOut of curiosity, what's your main focus at the expo this year ?",
         ]
 
+        # (template, bound format) pairs picked by the bulk send loops
+        self._follow_up_formatters = tuple(
+            (template, template.format)
+            for template in self.follow_up_messages
+        )
+
         # Second follow-up message that always gets sent after the first one
         self.second_follow_up_message = (
             "Is payments something on your radar to explore ?"
@@ -1150,11 +1166,7 @@ class SBCAttendeesScraper:
             return False
 
         # Отримуємо перше ім'я
-        first_name = (
-            participant_name.split()[0]
-            if participant_name.split()
-            else "there"
-        )
+        first_name = (participant_name.split(None, 1) or ["there"])[0]
 
         # Форматуємо повідомлення
         template = self.follow_up_templates[followup_type]
@@ -1933,9 +1945,7 @@ class SBCAttendeesScraper:
                     continue
 
                 # Відправляємо follow-up повідомлення
-                first_name = (
-                    full_name.split()[0] if full_name.split() else "there"
-                )
+                first_name = (full_name.split(None, 1) or ["there"])[0]
 
                 if self.send_followup_message(
                     chat_id, followup_type, first_name
@@ -2181,11 +2191,7 @@ class SBCAttendeesScraper:
                             continue
 
                         # Send follow-up message
-                        first_name = (
-                            full_name.split()[0]
-                            if full_name.split()
-                            else "there"
-                        )
+                        first_name = (full_name.split(None, 1) or ["there"])[0]
 
                         if self.send_followup_message(
                             chat_id, follow_up_type, first_name
@@ -2412,11 +2418,7 @@ class SBCAttendeesScraper:
                         user_id = match.group(1)
 
                         # Витягуємо перше ім'я
-                        first_name = (
-                            full_name.split()[0]
-                            if full_name.split()
-                            else "there"
-                        )
+                        first_name = (full_name.split(None, 1) or ["there"])[0]
 
                         user_data.append(
                             {
@@ -2495,10 +2497,8 @@ class SBCAttendeesScraper:
 
                                         # Витягуємо перше ім'я
                                         first_name = (
-                                            full_name.split()[0]
-                                            if full_name.split()
-                                            else "there"
-                                        )
+                                            full_name.split(None, 1) or ["there"]
+                                        )[0]
 
                                         user_data.append(
                                             {
@@ -2535,10 +2535,8 @@ class SBCAttendeesScraper:
 
                                         # Витягуємо перше ім'я
                                         first_name = (
-                                            full_name.split()[0]
-                                            if full_name.split()
-                                            else "there"
-                                        )
+                                            full_name.split(None, 1) or ["there"]
+                                        )[0]
 
                                         user_data.append(
                                             {
@@ -4420,12 +4418,20 @@ class SBCAttendeesScraper:
                     f"🔢 Застосовано ліміт: оброблятимемо {user_limit} з {original_count} доступних користувачів"
                 )
 
-        success_count = 0
-        failed_count = 0
-        skipped_count = 0
-        excluded_count = 0
+        counts = Counter()
+
+        # Templates for the whole batch, drawn in one call
+        templates = random.choices(
+            self._follow_up_formatters, k=len(user_data)
+        )
+
+        # The follow-up text is the same for every user in the batch
+        follow_up_line = (
+            f"   💬 + автоматичний follow-up: '{self.second_follow_up_message}'"
+        )
 
         for i, user_info in enumerate(user_data, 1):
+            started = time.monotonic()
             user_id = user_info["user_id"]
             first_name = user_info["first_name"]
             full_name = user_info["full_name"]
@@ -4438,14 +4444,13 @@ class SBCAttendeesScraper:
 
             try:
                 # Вибираємо випадкове повідомлення з шаблонів та підставляємо ім'я
-                message_template = random.choice(self.follow_up_messages)
-                message = message_template.format(name=first_name)
+                message_template, format_message = templates[i - 1]
+                message = format_message(name=first_name)
 
+                # Both lines go out in one write
                 print(
-                    f"   💬 Відправляємо: '{message_template[:50]}...' з ім'ям '{first_name}'"
-                )
-                print(
-                    f"   💬 + автоматичний follow-up: '{self.second_follow_up_message}'"
+                    f"   💬 Відправляємо: '{message_template[:50]}...' з ім'ям '{first_name}'\n"
+                    + follow_up_line
                 )
 
                 # Відправляємо повідомлення (з автоматичним follow-up та перевіркою чату)
@@ -4453,27 +4458,27 @@ class SBCAttendeesScraper:
                     user_id, message, full_name, company_name
                 )
 
-                if success == "success":
-                    print(f"   ✅ Повідомлення відправлено")
-                    success_count += 1
-                elif success == "already_contacted":
-                    print(f"   ⏭️ Пропущено (чат вже має повідомлення)")
-                    skipped_count += 1
-                elif success == "excluded_company":
-                    print(f"   🚫 Пропущено (компанія виключена)")
-                    excluded_count += 1
-                else:
-                    print(f"   ❌ Помилка відправки")
-                    failed_count += 1
+                if success not in SEND_RESULT_MESSAGES:
+                    success = "failed"
+                print(f"   {SEND_RESULT_MESSAGES[success]}")
+                counts[success] += 1
 
-                # Затримка між повідомленнями
+                # Затримка між повідомленнями, відлічена від початку
+                # обробки, тож час відправки входить у неї
                 if i < len(user_data):
-                    print(f"   ⏱️ Чекаємо {delay_seconds} секунд...")
-                    time.sleep(delay_seconds)
+                    remaining = delay_seconds - (time.monotonic() - started)
+                    if remaining > 0:
+                        print(f"   ⏱️ Чекаємо {remaining:.1f} секунд...")
+                        time.sleep(remaining)
 
             except Exception as e:
                 print(f"   ❌ Помилка: {e}")
-                failed_count += 1
+                counts["failed"] += 1
+
+        success_count = counts["success"]
+        failed_count = counts["failed"]
+        skipped_count = counts["already_contacted"]
+        excluded_count = counts["excluded_company"]
 
         print(f"\n📊 ПІДСУМОК РОЗСИЛКИ:")
         print(f"   ✅ Успішно: {success_count}")
@@ -5116,6 +5121,17 @@ class SBCAttendeesScraper:
         all_results = self.get_all_advanced_search_results()
         print(f"✅ Всього знайдено: {len(all_results)} учасників")
 
+        # Overlapping pages can return the same attendee twice; keep the
+        # first copy so their details are fetched only once
+        unique_results = {}
+        for attendee in all_results:
+            attendee_id = attendee.get("id")
+            if attendee_id and attendee_id not in unique_results:
+                unique_results[attendee_id] = attendee
+        if len(unique_results) != len(all_results):
+            print(f"🔁 Унікальних учасників: {len(unique_results)}")
+        all_results = list(unique_results.values())
+
         # 2. Завантажуємо існуючу базу
         print("\n📋 Етап 2: Порівняння з існуючою базою...")
         existing_keys = self.load_existing_attendees(csv_file_path)
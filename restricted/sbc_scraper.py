@@ -8,21 +8,44 @@ using the new modular structure.
 
 import sys
 import os
+import argparse
 
 # Add the restricted directory to Python path so we can import api_scraping
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from api_scraping.log_setup import setup_logging
 from api_scraping.main_scraper import SBCAttendeesScraper
 from config import settings
 
 
+def parse_args():
+    """Parses command line options"""
+    parser = argparse.ArgumentParser(description="SBC Attendees Scraper")
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="show per-request progress messages",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="ignore cached user details and fetch them again",
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main entry point for the application"""
+    args = parse_args()
+    log_listener = setup_logging(args.verbose)
+
     print("🚀 Starting SBC Attendees Scraper (Refactored Version)")
     print("=" * 60)
 
     proxy_config = settings.get_proxy_config()
-    scraper = SBCAttendeesScraper(headless=False, proxy_config=proxy_config)
+    scraper = SBCAttendeesScraper(
+        headless=False, proxy_config=proxy_config, refresh_cache=args.refresh
+    )
 
     try:
         # Start browser and login
@@ -43,6 +66,7 @@ def main():
     finally:
         # Clean up
         scraper.close()
+        log_listener.stop()
         print("🔒 Application closed")
 
 